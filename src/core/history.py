@@ -3,6 +3,7 @@ import os
 import datetime
 from typing import List, Dict, Any, Optional, Union
 import logging
+import threading
 from collections import defaultdict
 
 class HistoryManager:
@@ -10,6 +11,17 @@ class HistoryManager:
         self.file_path = file_path
         self.logger = logging.getLogger(__name__)
         
+        # Incremented on every write so views can tell whether their data is stale
+        self._version = 0
+        
+        # In-memory mirror of the history file as its JSON text; None until first loaded or
+        # after a failed write. Keeping the text means every read decodes fresh entries
+        self._cached = None
+        # (mtime, size) of the file when the mirror was taken, to notice changes by other processes
+        self._cached_stamp = None
+        # Serializes read-modify-write updates; the solver saves from a worker thread
+        self._write_lock = threading.Lock()
+        
         # Create history file if it doesn't exist
         if not os.path.exists(self.file_path):
             self._save_empty_history()
@@ -17,12 +29,49 @@ class HistoryManager:
     def _save_empty_history(self) -> None:
         """Create an empty history file."""
         try:
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                json.dump([], f, ensure_ascii=False, indent=2)
+            self._write_history([])
         except IOError as e:
             self.logger.error(f"Failed to create empty history file: {str(e)}")
             raise
 
+    def _write_history(self, history: List[Dict[str, Any]]) -> None:
+        """
+        Write the full history list to disk, then make the written text the in-memory mirror and bump the data version.
+        
+        The mirror holds what was serialized, not the caller's objects, so later
+        changes to history or its rows do not reach load_history.
+        """
+        try:
+            text = json.dumps(history, ensure_ascii=False, indent=2)
+            with open(self.file_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+        except Exception:
+            # The file may be partly written; reload from disk next time
+            self._cached = None
+            raise
+        self._cached = text
+        self._cached_stamp = self._file_stamp()
+        self._version += 1
+
+    def _file_stamp(self) -> Optional[tuple]:
+        """Return the history file's (mtime, size), or None if it cannot be read."""
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _drop_stale_cache(self) -> None:
+        """Forget the in-memory history if the file was changed outside this manager."""
+        if self._cached is not None and self._file_stamp() != self._cached_stamp:
+            self._cached = None
+            self._version += 1
+
+    def version(self) -> int:
+        """Return a counter that changes whenever the history file is written."""
+        self._drop_stale_cache()
+        return self._version
+
     def _validate_solution_data(self, func: str, method: str, root: Union[float, List[float]], table: List[Dict[str, Any]]) -> bool:
         """Validate the solution data before saving."""
         if not isinstance(func, str) or not func:
@@ -57,14 +106,12 @@ class HistoryManager:
             return False
             
         try:
-            # Load existing history
-            history = self.load_history()
-            
-            # Ensure all table entries are dictionaries
+            # Ensure all table entries are dictionaries; each is copied, so the caller
+            # can keep editing its table without changing the saved entry
             validated_table = []
             for row in table:
                 if isinstance(row, dict):
-                    validated_table.append(row)
+                    validated_table.append(dict(row))
                 else:
                     # Skip non-dictionary rows or convert to a simple message dict
                     self.logger.warning(f"Skipping non-dictionary row: {row}")
@@ -83,12 +130,9 @@ class HistoryManager:
                 "tags": tags or []
             }
             
-            # Add to history
-            history.append(solution)
-            
-            # Save updated history
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                json.dump(history, f, ensure_ascii=False, indent=2)
+            # Build the updated history as a new list and swap it in once written
+            with self._write_lock:
+                self._write_history(self.load_history() + [solution])
                 
             return True
         except Exception as e:
@@ -96,13 +140,29 @@ class HistoryManager:
             return False
 
     def load_history(self) -> List[Dict[str, Any]]:
-        """Load the solution history."""
+        """
+        Load the solution history, reading the file only when it changed since the last read or write.
+        
+        Returns newly decoded entries each time, so callers may change them, sort or filter
+        without touching the mirror.
+        """
+        self._drop_stale_cache()
+        cached = self._cached
+        if cached is not None:
+            return json.loads(cached)
+        
         try:
             if not os.path.exists(self.file_path):
                 return []
-                
+            
+            # Stamp before reading, so a write racing with the read is picked up next time
+            stamp = self._file_stamp()
             with open(self.file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+                text = f.read()
+            history = json.loads(text)
+            self._cached = text
+            self._cached_stamp = stamp
+            return history
         except Exception as e:
             self.logger.error(f"Failed to load history: {str(e)}")
             return []
@@ -110,7 +170,8 @@ class HistoryManager:
     def clear_history(self) -> bool:
         """Clear the solution history."""
         try:
-            self._save_empty_history()
+            with self._write_lock:
+                self._save_empty_history()
             return True
         except Exception as e:
             self.logger.error(f"Failed to clear history: {str(e)}")
@@ -128,17 +189,17 @@ class HistoryManager:
     def delete_solution(self, index: int) -> bool:
         """Delete a specific solution by index."""
         try:
-            history = self.load_history()
-            
-            if 0 <= index < len(history):
-                del history[index]
+            with self._write_lock:
+                history = self.load_history()
                 
-                with open(self.file_path, 'w', encoding='utf-8') as f:
-                    json.dump(history, f, ensure_ascii=False, indent=2)
+                if 0 <= index < len(history):
+                    del history[index]
                     
-                return True
-            else:
-                return False
+                    self._write_history(history)
+                        
+                    return True
+                else:
+                    return False
         except Exception as e:
             self.logger.error(f"Failed to delete solution: {str(e)}")
             return False
@@ -283,25 +344,25 @@ class HistoryManager:
             bool: True if successful
         """
         try:
-            history = self.load_history()
-            
-            if 0 <= index < len(history):
-                # Get current tags or initialize empty list
-                tags = history[index].get("tags", [])
+            with self._write_lock:
+                history = self.load_history()
                 
-                # Add tag if not already present
-                if tag not in tags:
-                    tags.append(tag)
-                    history[index]["tags"] = tags
+                if 0 <= index < len(history):
+                    # Get current tags or initialize empty list
+                    tags = history[index].get("tags", [])
                     
-                    # Save updated history
-                    with open(self.file_path, 'w', encoding='utf-8') as f:
-                        json.dump(history, f, ensure_ascii=False, indent=2)
+                    # Add tag if not already present
+                    if tag not in tags:
+                        # Replace the entry rather than editing the one shared with the in-memory history
+                        history[index] = dict(history[index], tags=tags + [tag])
                         
-                    return True
-                return True  # Tag already exists, still successful
-            else:
-                return False
+                        # Save updated history
+                        self._write_history(history)
+                            
+                        return True
+                    return True  # Tag already exists, still successful
+                else:
+                    return False
                 
         except Exception as e:
             self.logger.error(f"Error adding tag to solution: {str(e)}")
@@ -319,25 +380,27 @@ class HistoryManager:
             bool: True if successful
         """
         try:
-            history = self.load_history()
-            
-            if 0 <= index < len(history):
-                # Get current tags
-                tags = history[index].get("tags", [])
+            with self._write_lock:
+                history = self.load_history()
                 
-                # Remove tag if present
-                if tag in tags:
-                    tags.remove(tag)
-                    history[index]["tags"] = tags
+                if 0 <= index < len(history):
+                    # Get current tags
+                    tags = history[index].get("tags", [])
                     
-                    # Save updated history
-                    with open(self.file_path, 'w', encoding='utf-8') as f:
-                        json.dump(history, f, ensure_ascii=False, indent=2)
+                    # Remove tag if present
+                    if tag in tags:
+                        tags = list(tags)
+                        tags.remove(tag)
+                        # Replace the entry rather than editing the one shared with the in-memory history
+                        history[index] = dict(history[index], tags=tags)
                         
-                    return True
-                return True  # Tag doesn't exist, still successful
-            else:
-                return False
+                        # Save updated history
+                        self._write_history(history)
+                            
+                        return True
+                    return True  # Tag doesn't exist, still successful
+                else:
+                    return False
                 
         except Exception as e:
             self.logger.error(f"Error removing tag from solution: {str(e)}")
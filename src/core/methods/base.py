@@ -3,6 +3,10 @@ import sympy as sp
 import numpy as np
 import math
 import logging
+import re
+
+# "math." in front of a function sympy knows by the bare name (log also covers log10)
+MATH_PREFIX = re.compile(r"\bmath\.(?=(?:sin|cos|tan|log|exp|sqrt))")
 
 class NumericalMethodBase:
     def __init__(self):
@@ -59,13 +63,7 @@ class NumericalMethodBase:
         """
         try:
             # Replace common math functions with sympy equivalents
-            func_str = func_str.replace("math.sin", "sin")
-            func_str = func_str.replace("math.cos", "cos")
-            func_str = func_str.replace("math.tan", "tan")
-            func_str = func_str.replace("math.log", "log")
-            func_str = func_str.replace("math.log10", "log10")
-            func_str = func_str.replace("math.exp", "exp")
-            func_str = func_str.replace("math.sqrt", "sqrt")
+            func_str = MATH_PREFIX.sub("", func_str)
             
             # Parse the function string into a sympy expression
             expr = sp.sympify(func_str)
@@ -114,13 +112,7 @@ class NumericalMethodBase:
         """
         try:
             # Replace common math functions with sympy equivalents
-            func_str = func_str.replace("math.sin", "sin")
-            func_str = func_str.replace("math.cos", "cos")
-            func_str = func_str.replace("math.tan", "tan")
-            func_str = func_str.replace("math.log", "log")
-            func_str = func_str.replace("math.log10", "log10")
-            func_str = func_str.replace("math.exp", "exp")
-            func_str = func_str.replace("math.sqrt", "sqrt")
+            func_str = MATH_PREFIX.sub("", func_str)
             
             # Parse the function string into a sympy expression
             expr = sp.sympify(func_str)
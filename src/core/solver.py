@@ -6,13 +6,29 @@ from src.core.methods import (BisectionMethod, FalsePositionMethod,
                               GaussJordanMethod, GaussJordanPartialPivotingMethod,
                               CramersRuleMethod)
 from src.core.history import HistoryManager
+from src.core.methods.base import MATH_PREFIX
 import sympy as sp
 import numpy as np
 import logging
 import re
 import ast
+import copy
+import threading
+from collections import OrderedDict
 
 class Solver:
+    # Calculation settings restored by apply_defaults()
+    DEFAULT_SETTINGS = {
+        "decimal_places": 6,
+        "max_iter": 50,
+        "eps": 0.0001,
+        "max_eps": 100.0,  # Maximum allowed epsilon value
+        "stop_by_eps": True
+    }
+
+    # Number of results kept by solve() for repeated submissions
+    SOLVE_CACHE_SIZE = 64
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.methods = {
@@ -89,14 +105,40 @@ class Solver:
         }
         
         # Default settings
-        self.decimal_places = 6
-        self.max_iter = 50
-        self.eps = 0.0001
-        self.max_eps = 100.0  # Maximum allowed epsilon value
-        self.stop_by_eps = True
+        self.apply_defaults()
         
         # Initialize history manager
         self.history_manager = HistoryManager()
+        
+        # Recent successful results keyed by _cache_key, least recently used first; only the
+        # computation is cached, solve() still saves every run to history
+        self._solve_cache = OrderedDict()
+        # solve() runs on a new worker thread per submission, and a superseded worker keeps running
+        self._solve_cache_lock = threading.Lock()
+
+    def apply_settings(self, **settings: Any) -> None:
+        """
+        Apply several calculation settings in one step.
+        
+        All names are checked before anything is assigned, so an unknown
+        setting leaves the solver unchanged.
+        
+        Args:
+            **settings: Values keyed by names from DEFAULT_SETTINGS
+            
+        Raises:
+            ValueError: If a setting name is not recognised
+        """
+        unknown = set(settings) - set(self.DEFAULT_SETTINGS)
+        if unknown:
+            raise ValueError(f"Unknown settings: {', '.join(sorted(unknown))}")
+        
+        for name, value in settings.items():
+            setattr(self, name, value)
+
+    def apply_defaults(self) -> None:
+        """Restore all calculation settings to their default values."""
+        self.apply_settings(**self.DEFAULT_SETTINGS)
 
     def validate_function(self, func: str) -> Optional[str]:
         """Validate the mathematical function expression."""
@@ -105,13 +147,7 @@ class Solver:
             func = func.strip()
             
             # Replace common math functions with sympy equivalents
-            func = func.replace("math.sin", "sin")
-            func = func.replace("math.cos", "cos")
-            func = func.replace("math.tan", "tan")
-            func = func.replace("math.log", "log")
-            func = func.replace("math.log10", "log10")
-            func = func.replace("math.exp", "exp")
-            func = func.replace("math.sqrt", "sqrt")
+            func = MATH_PREFIX.sub("", func)
             
             # Add multiplication operator between number and variable
             func = re.sub(r'(\d)x', r'\1*x', func)
@@ -316,13 +352,50 @@ class Solver:
             Tuple of (root, table_data) where root is the solution or None if not found,
             and table_data is a list of dictionaries containing iteration details
         """
-        try:
-            # Use default values if not provided
-            eps = eps if eps is not None else self.eps
-            max_iter = max_iter if max_iter is not None else self.max_iter
-            stop_by_eps = stop_by_eps if stop_by_eps is not None else self.stop_by_eps
-            decimal_places = decimal_places if decimal_places is not None else self.decimal_places
+        # Use default values if not provided, so a change in settings never hits a stale cache entry
+        eps = eps if eps is not None else self.eps
+        max_iter = max_iter if max_iter is not None else self.max_iter
+        stop_by_eps = stop_by_eps if stop_by_eps is not None else self.stop_by_eps
+        decimal_places = decimal_places if decimal_places is not None else self.decimal_places
+        
+        key = self._cache_key(method_name, func, params, eps, eps_operator, max_iter, stop_by_eps, decimal_places)
+        cached = None
+        if key is not None:
+            with self._solve_cache_lock:
+                cached = self._solve_cache.get(key)
+                if cached is not None:
+                    self._solve_cache.move_to_end(key)
+        if cached is not None:
+            # Every caller gets its own result and rows, so editing them cannot change the cached answer
+            result, table = copy.deepcopy(cached)
+        else:
+            # Computed outside the lock so a long run does not hold up other workers
+            result, table = self._compute(method_name, func, params, eps, eps_operator, max_iter, stop_by_eps, decimal_places)
+            # Failed runs are not cached, so a retry runs the method again
+            if key is not None and result is not None:
+                entry = copy.deepcopy((result, table))
+                with self._solve_cache_lock:
+                    self._solve_cache[key] = entry
+                    self._solve_cache.move_to_end(key)
+                    if len(self._solve_cache) > self.SOLVE_CACHE_SIZE:
+                        self._solve_cache.popitem(last=False)
+        
+        # Save every solved run to history, including repeats answered from the cache
+        if result is not None:
+            if method_name in self.method_categories["linear_system"]:
+                # For linear system methods, use "System of Linear Equations" as the function name
+                self.history_manager.save_solution("System of Linear Equations", method_name, result, table)
+            else:
+                # For structured result objects, extract the root for saving to history
+                history_result = result.root if hasattr(result, 'root') else result
+                self.history_manager.save_solution(func, method_name, history_result, table)
+        
+        return result, table
 
+    def _compute(self, method_name: str, func: str, params: dict, eps: float, eps_operator: str, max_iter: int,
+                 stop_by_eps: bool, decimal_places: int) -> Tuple[Union[float, List[float], None], List[Dict]]:
+        """Run the numerical method with all settings resolved; solve() caches this and saves to history."""
+        try:
             # Validate inputs
             if method_name not in self.methods:
                 return None, [{"Error": f"Unknown method: {method_name}"}]
@@ -345,19 +418,7 @@ class Solver:
                     return None, [{"Error": validation_error}]
                 
                 # Call the method
-                result, table = self.methods[method_name].solve(matrix, vector, decimal_places)
-                
-                # Save to history with a placeholder function name
-                if result is not None:
-                    # For linear system methods, use "System of Linear Equations" as the function name
-                    self.history_manager.save_solution(
-                        "System of Linear Equations",
-                        method_name,
-                        result,
-                        table
-                    )
-                
-                return result, table
+                return self.methods[method_name].solve(matrix, vector, decimal_places)
             else:
                 # Validate function
                 func_error = self.validate_function(func)
@@ -419,26 +480,28 @@ class Solver:
                     # Fallback for any other methods
                     result, table = self.methods[method_name].solve(func, params, eps, eps_operator, max_iter, stop_by_eps, decimal_places)
                 
-                # Save to history
-                if result is not None:
-                    # For structured result objects, extract the root for saving to history
-                    history_result = result
-                    if hasattr(result, 'root'):
-                        history_result = result.root
-                    
-                    self.history_manager.save_solution(
-                        func,
-                        method_name,
-                        history_result,
-                        table
-                    )
-                
                 return result, table
                 
         except Exception as e:
             self.logger.error(f"Solver error: {str(e)}")
             return None, [{"Error": f"Solver error: {str(e)}"}]
 
+    @staticmethod
+    def _cache_key(method_name: str, func: str, params: dict, *settings: Any) -> Optional[tuple]:
+        """Return the solve cache key, or None if the arguments cannot be hashed."""
+        def freeze(value):
+            # Tag lists so a list and a tuple with the same items get different keys
+            if isinstance(value, list):
+                return (list, tuple(freeze(item) for item in value))
+            return value
+        
+        key = (method_name, func, tuple(sorted((name, freeze(value)) for name, value in (params or {}).items())), settings)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
     def get_recommended_methods(self, problem_type: str, matrix_size: int = None, condition_number: float = None) -> List[str]:
         """
         Get recommended methods based on problem characteristics.
@@ -1,24 +1,160 @@
 import customtkinter as ctk
-from tkinter import ttk
+import tkinter as tk
 from src.ui.widgets.input_form import InputForm
 from src.ui.widgets.table import ResultTable
 from src.ui.widgets.sidebar import Sidebar
 from src.core.solver import Solver
-from src.core.history import HistoryManager
 from src.ui.theme import ThemeManager
-from src.utils.export import export_to_pdf
 import logging
+import numpy as np
+import queue
+import re
 from collections import OrderedDict
+from contextlib import contextmanager
+from functools import wraps
 from src.core.methods.newton_raphson import ConvergenceStatus as NewtonConvergenceStatus
 from src.core.methods.secant import ConvergenceStatus as SecantConvergenceStatus
 import threading
 import time
 
+logger = logging.getLogger(__name__)
+
+# Static About screen content, built once at import time
+_ABOUT_FEATURES = (
+    "📊 Multiple numerical methods for root finding and equation solving",
+    "📈 Interactive function plotting with error analysis",
+    "📋 Detailed step-by-step solution visualization",
+    "📁 Export results to various formats (CSV, Excel, PDF)",
+    "🔧 Customizable calculation settings and precision control",
+    "📱 Responsive interface with modern design",
+    "💾 Solution history for reviewing past calculations",
+)
+
+_ABOUT_METHODS_LEFT = (
+    "• Bisection Method",
+    "• Newton-Raphson Method",
+    "• Secant Method",
+    "• Fixed-Point Iteration",
+)
+
+_ABOUT_METHODS_RIGHT = (
+    "• Gauss Elimination",
+    "• Gauss-Jordan Method",
+    "• LU Decomposition",
+    "• Cramer's Rule",
+)
+
+_ABOUT_RELEASE = "Release Date: May 2024"
+
+_ABOUT_CREDITS = (
+    "Developed by Hosam Dyab and Hazem Mohamed\n"
+    "Special thanks to all numerical analysis and scientific computing communities"
+)
+
+_ABOUT_TECH_ITEMS = (
+    "• Python - Core programming language",
+    "• CustomTkinter - Modern UI framework",
+    "• NumPy - Numerical computations and array operations",
+    "• Matplotlib - Data visualization and plotting",
+    "• SymPy - Symbolic mathematics for equation parsing",
+)
+
+# Settings screen form: (card title, rows); each row is
+# (variable key, label, widget kind, widget options, hint)
+_SETTINGS_FIELDS = (
+    ("Calculation Settings", (
+        ("decimal", "Default Decimal Places:", "int_entry",
+         {"placeholder_text": "e.g., 6"}, "Affects display precision"),
+        ("iter", "Maximum Iterations:", "int_entry",
+         {"placeholder_text": "e.g., 50"}, "Higher values may increase accuracy"),
+        ("eps", "Error Tolerance:", "float_entry",
+         {"placeholder_text": "e.g., 0.0001"}, "Lower values increase precision"),
+        ("max_eps", "Maximum Epsilon Value:", "float_entry",
+         {"placeholder_text": "e.g., 1.0"}, "Upper bound for convergence check"),
+        ("stop", "Stop Condition:", "option",
+         {"values": ["Error Tolerance", "Maximum Iterations", "Both"]}, "Determines when to stop iterations"),
+    )),
+    ("User Interface Settings", (
+        # Values come from the theme manager; currently only the light theme is available
+        ("theme", "Application Theme:", "option",
+         {}, "More themes coming soon"),
+        ("font", "Font Size:", "option",
+         {"values": ["Small", "Medium", "Large"]}, "Affects UI text size"),
+        ("autosave", "Auto-save Results:", "switch",
+         {}, "Automatically save calculation results"),
+    )),
+    ("Advanced Settings", (
+        ("export", "Default Export Format:", "option",
+         {"values": ["CSV", "Excel", "PDF", "JSON"]}, "For exporting calculation results"),
+        ("timeout", "Calculation Timeout (sec):", "int_entry",
+         {"placeholder_text": "e.g., 30"}, "Maximum time before cancellation"),
+    )),
+)
+
+# Numeric settings validated on save: (form key, "solver" or "app", attribute,
+# parser, zero allowed, name in error messages, rule violated by bad values)
+_SETTINGS_NUMBERS = (
+    ("decimal", "solver", "decimal_places", int, True, "decimal places", "Decimal places must be non-negative"),
+    ("iter", "solver", "max_iter", int, False, "maximum iterations", "Maximum iterations must be positive"),
+    ("eps", "solver", "eps", float, False, "error tolerance", "Error tolerance must be positive"),
+    ("max_eps", "solver", "max_eps", float, False, "maximum epsilon", "Maximum epsilon must be positive"),
+    ("timeout", "app", "timeout", int, False, "timeout", "Timeout must be positive"),
+)
+
+def _parse_setting(spec, text):
+    """Parse text for a _SETTINGS_NUMBERS row; raise ValueError with the message shown to the user."""
+    key, target, attribute, parse, allow_zero, name, rule = spec
+    try:
+        value = parse(text)
+        if value < 0 or (value == 0 and not allow_zero):
+            raise ValueError(rule)
+    except ValueError as e:
+        raise ValueError(f"Invalid {name}: {str(e)}")
+    return value
+
+# Settings widget kinds: (widget class, variable keyword, fixed options)
+_SETTINGS_WIDGETS = {
+    "int_entry": (ctk.CTkEntry, "textvariable", {"width": 120}),
+    "float_entry": (ctk.CTkEntry, "textvariable", {"width": 120}),
+    "option": (ctk.CTkOptionMenu, "variable", {"width": 120}),
+    "switch": (ctk.CTkSwitch, "variable", {"text": "", "width": 60}),
+}
+
+# Text accepted while typing into numeric settings entries; save still checks the full value
+_ENTRY_PATTERNS = {
+    "int_entry": re.compile(r"\d*"),
+    "float_entry": re.compile(r"[0-9.eE+-]*"),
+}
+
+def _screen(name, error_message):
+    """Give a show_* method the guards shared by all screens.
+    
+    The call is skipped when screen name is already shown and deferred while the
+    window is hidden; if the method fails, the error is logged and the error
+    screen replaces the content.
+    """
+    def decorate(show):
+        @wraps(show)
+        def wrapper(self):
+            # Nothing to do if this screen is already shown
+            if self._current_screen == name:
+                return
+            
+            # Defer the build while the window is minimized or withdrawn
+            if self._defer_until_visible(getattr(self, show.__name__)):
+                return
+            
+            try:
+                show(self)
+            except Exception as e:
+                logger.exception(error_message)
+                self._show_error_screen(f"{error_message}: {e}")
+        return wrapper
+    return decorate
+
 class NumericalApp:
     def __init__(self):
         """Initialize the application."""
-        # Initialize logging before any other operations
-        self.logger = logging.getLogger(__name__)
         self.version = "1.0.0"  # Add version attribute
         
         # Flag to indicate if the application is shutting down - set first
@@ -27,11 +163,55 @@ class NumericalApp:
         # Initialize attributes to track after events
         self.after_ids = {}
         
+        # Hidden "Solution Details" window for the last solution, re-shown on the next press
+        self._full_solution_window = None
+        
+        # Cached screen root frames by name, built on first visit and detached on navigation
+        self._screens = {}
+        
+        # Screen widgets re-colored by update_ui_theme, one list per widget kind
+        self._theme_frames = []
+        self._theme_labels = []
+        self._theme_buttons = []
+        self._theme_primary_buttons = []
+        
+        # (after id, hide callback) of the transient message currently shown
+        self._pending_toast = None
+        
+        # Name of the screen currently shown in the content frame, and its packed frame
+        self._current_screen = ""
+        self._current_panel = None
+        
+        # PDF exporter, imported on the first export so reportlab stays out of startup
+        self._export_fn = None
+        
+        # Hash of the theme last applied to the ttk table style
+        self._applied_theme_hash = None
+        
+        # Screen requested while the window was hidden, shown again on <Map>
+        self._pending_screen = None
+        
+        # Tk variable names whose trace callbacks are temporarily silenced
+        self._suspended_vars = set()
+        
         # Create the main window
         self.root = ctk.CTk()
         self.root.title("Numerical Analysis App")
         self.root.geometry("1000x700")
         
+        # Canonical fonts shared by all screens; Tk fonts need the root window to exist
+        self._fonts = {
+            "display": ctk.CTkFont(size=28, weight="bold"),
+            "title": ctk.CTkFont(size=24, weight="bold"),
+            "section": ctk.CTkFont(size=18, weight="bold"),
+            "subheading": ctk.CTkFont(size=16, weight="bold"),
+            "btn": ctk.CTkFont(size=14, weight="bold"),
+            "body": ctk.CTkFont(size=14),
+            "caption_bold": ctk.CTkFont(size=12, weight="bold"),
+            "caption": ctk.CTkFont(size=12),
+            "header": ctk.CTkFont(family="Helvetica", size=24, weight="bold"),
+        }
+        
         # Add threading lock to prevent race conditions
         self.calculation_lock = threading.Lock()
         self.calculation_thread = None
@@ -47,11 +227,19 @@ class NumericalApp:
             # Register early close handler
             self.root.protocol("WM_DELETE_WINDOW", on_early_close)
             
-            # Initialize core components
-            self.theme_manager = ThemeManager()
-            self.history_manager = HistoryManager()
-            self.solver = Solver()
+            # Shortcut back to the home screen; bound on the main window only, so
+            # Escape in dialogs such as Solution Details does not reach it
+            self.root.bind("<Escape>", self._on_escape)
+            
+            # Initialize core components; the solver is created in the background while the splash shows
+            self.theme_manager = ThemeManager(self.root)
+            self._theme_names = tuple(self.theme_manager.themes.keys())
+            self.solver = None
+            self.history_manager = None
+            self._init_done = threading.Event()
+            self._init_error = None
             self.theme = self.theme_manager.apply_theme()
+            self._refresh_theme_cache()
             
             # Configure visual styles
             self.configure_table_style()
@@ -63,14 +251,57 @@ class NumericalApp:
             if not self.is_shutting_down:
                 self.setup_welcome_screen()
                 
+                # Build the solver off the main thread; the splash polls for completion
+                threading.Thread(target=self._init_core, daemon=True).start()
+                
                 # Register the proper close handler once initialization is complete
                 self.root.protocol("WM_DELETE_WINDOW", self.on_close)
                 
-        except Exception as e:
-            self.logger.error(f"Error initializing app: {str(e)}")
+        except Exception:
+            logger.exception("Error initializing app")
             self.is_shutting_down = True
             raise
     
+    def _init_core(self):
+        """Create the solver and history manager, then set _init_done. Runs in a worker thread."""
+        try:
+            solver = Solver()
+            # The registered methods never change after construction
+            self._method_names = tuple(solver.methods.keys())
+            # Share the solver's history manager so saved solutions bump the same version
+            self.history_manager = solver.history_manager
+            self.solver = solver
+        except Exception as e:
+            logger.exception("Error initializing solver")
+            self._init_error = e
+        finally:
+            self._init_done.set()
+        
+        # The UI no longer waits on this thread, so use it to load the PDF exporter
+        # (reportlab is slow to import) for export_solution before the first export needs it
+        try:
+            from src.utils.export import export_to_pdf
+            self._export_fn = export_to_pdf
+        except Exception as e:
+            logger.debug("PDF export preload skipped: %s", e)
+
+    def _poll_init(self):
+        """Leave the welcome screen as soon as background initialization has finished."""
+        if self._init_done.is_set():
+            self.show_main_window()
+        else:
+            self.safe_after(50, self._poll_init, "welcome_transition")
+
+    @property
+    def version(self):
+        """Application version string shown on the welcome and about screens."""
+        return self._version
+
+    @version.setter
+    def version(self, value):
+        self._version = value
+        self._version_text = f"Version: {value}"
+
     def on_close(self):
         """Handle window close event."""
         try:
@@ -105,51 +336,50 @@ class NumericalApp:
                     # Destroy the window and exit mainloop
                     self.root.quit()
                     self.root.destroy()
-                except Exception as e:
-                    self.logger.error(f"Error during normal window close: {e}")
+                except Exception:
+                    logger.exception("Error during normal window close")
                     # Force destroy as a last resort
                     try:
                         if hasattr(self, 'root') and self.root.winfo_exists():
                             self.root.destroy()
                     except:
                         pass
-        except Exception as e:
-            self.logger.error(f"Error during window close: {e}")
+        except Exception:
+            logger.exception("Error during window close")
             # Force exit in case of failure
             import sys
             sys.exit(0)
 
     def configure_table_style(self):
-        """Configure the table style for better visibility."""
+        """Configure the table style for better visibility, skipping it if the theme is unchanged."""
         try:
-            style = ttk.Style()
+            # Every style command is a Tcl round-trip, so only reapply when the colors changed
+            theme_hash = hash(tuple(sorted(self.theme.items())))
+            if theme_hash == self._applied_theme_hash:
+                return
             
             # Configure the main table style
-            style.configure("Custom.Treeview",
+            self.theme_manager.configure_style("Custom.Treeview",
                           background=self.theme["table_bg"],
                           foreground=self.theme["table_fg"],
                           fieldbackground=self.theme["table_bg"],
                           rowheight=25)
             
             # Configure the table heading style
-            style.configure("Custom.Treeview.Heading",
+            self.theme_manager.configure_style("Custom.Treeview.Heading",
                           background=self.theme["table_heading_bg"],
                           foreground=self.theme["table_heading_fg"],
                           font=("Helvetica", 10, "bold"))
             
             # Configure selection colors
-            style.map("Custom.Treeview",
-                     background=[("selected", self.theme["button"])],
-                     foreground=[("selected", self.theme["text"])])
-            
-            # Configure row colors
-            style.map("Custom.Treeview",
+            self.theme_manager.ttk_style.map("Custom.Treeview",
                      background=[("selected", self.theme["button"])],
                      foreground=[("selected", self.theme["text"])])
             
-            self.logger.info("Table style configured successfully")
-        except Exception as e:
-            self.logger.error(f"Error configuring table style: {str(e)}")
+            self._applied_theme_hash = theme_hash
+            logger.info("Table style configured successfully")
+        except Exception:
+            logger.exception("Error configuring table style")
 
     def setup_welcome_screen(self):
         """Initialize and display the welcome screen."""
@@ -158,7 +388,7 @@ class NumericalApp:
             if getattr(self, 'is_shutting_down', False):
                 return
                 
-            self.welcome_frame = ctk.CTkFrame(self.root, fg_color=self.theme["bg"])
+            self._register("welcome_frame", ctk.CTkFrame(self.root, fg_color=self.theme["bg"]))
             self.welcome_frame.pack(fill="both", expand=True)
             
             # Create a container for welcome content
@@ -192,33 +422,38 @@ class NumericalApp:
             )
             loading_label.pack()
             
-            # Define show_main window as a local function to avoid scheduling issues
-            def delayed_show_main():
-                # Check again just before showing the main window
-                if not getattr(self, 'is_shutting_down', False) and hasattr(self, 'root') and self.root.winfo_exists():
-                    self.show_main_window()
+            # Indeterminate progress bar; CustomTkinter animates it on its own timer
+            progress_bar = ctk.CTkProgressBar(welcome_container, mode="indeterminate", width=240)
+            progress_bar.pack(pady=(10, 0))
+            progress_bar.start()
             
-            # Schedule transition to main window using safe_after
-            self.safe_after(2000, delayed_show_main, "welcome_transition")
+            # Show the main window once initialization is done instead of after a fixed delay;
+            # safe_after skips the poll when the application is shutting down
+            self.safe_after(50, self._poll_init, "welcome_transition")
             
-        except Exception as e:
-            self.logger.error(f"Error setting up welcome screen: {str(e)}")
+        except Exception:
+            logger.exception("Error setting up welcome screen")
             raise
 
     def show_main_window(self):
         """Transition from welcome screen to main window."""
         try:
+            # The screens below need the solver built by _init_core
+            self._init_done.wait()
+            if self._init_error is not None:
+                raise self._init_error
+            
             # Cancel any pending welcome screen after events
             if "welcome_transition" in self.after_ids:
                 try:
                     self.root.after_cancel(self.after_ids["welcome_transition"])
                 except Exception as e:
-                    self.logger.debug(f"Error canceling welcome transition: {e}")
+                    logger.debug("Error canceling welcome transition: %s", e)
                 # Remove from tracking dictionary
                 del self.after_ids["welcome_transition"]
             
             # Destroy welcome frame if it exists
-            if hasattr(self, "welcome_frame") and self.welcome_frame.winfo_exists():
+            if getattr(self, "welcome_frame_alive", False):
                 self.welcome_frame.destroy()
             
             # Create main frame
@@ -233,7 +468,7 @@ class NumericalApp:
             ctk.CTkLabel(
                 self.header, 
                 text="Numerical Analysis", 
-                font=("Helvetica", 24, "bold"), 
+                font=self._fonts["header"], 
                 text_color=self.theme["accent"]
             ).pack(side="left", padx=20)
             
@@ -241,29 +476,101 @@ class NumericalApp:
             self.sidebar = Sidebar(
                 self.main_frame, 
                 self.theme, 
-                self.show_home, 
-                self.show_history, 
-                self.show_settings, 
-                self.show_about
+                lambda: self._navigate(self.show_home), 
+                lambda: self._navigate(self.show_history), 
+                lambda: self._navigate(self.show_settings), 
+                lambda: self._navigate(self.show_about)
             )
             
             # Create content frame
-            self.content_frame = ctk.CTkFrame(self.main_frame, fg_color=self.theme["bg"])
+            self._register("content_frame", ctk.CTkFrame(self.main_frame, fg_color=self.theme["bg"]))
             self.content_frame.pack(side="left", fill="both", expand=True)
             
+            # Run screen requests that arrived while the window was hidden once it is mapped
+            self.root.bind("<Map>", self._on_root_map, add="+")
+            
             # Show home screen
             self.show_home()
             
-        except Exception as e:
-            self.logger.error(f"Error showing main window: {str(e)}")
+        except Exception:
+            logger.exception("Error showing main window")
             raise
 
+    def _on_escape(self, event=None):
+        """Return to the home screen once the main window is up.
+        
+        Escape pressed in an entry field (e.g. to leave it) is left alone.
+        """
+        widget = getattr(event, "widget", None)
+        if isinstance(widget, tk.Entry):
+            return
+        if isinstance(widget, tk.Misc) and widget.winfo_toplevel() is not self.root:
+            return
+        if getattr(self, "content_frame_alive", False):
+            self._navigate(self.show_home)
+
+    def _navigate(self, show_screen):
+        """Show show_screen from the event loop instead of inside the triggering event.
+        
+        Requests share one named callback, so a burst of navigation clicks
+        collapses into a single screen switch to the latest target.
+        """
+        self.safe_after(0, show_screen, "navigate")
+
+    def _defer_until_visible(self, show_screen):
+        """Postpone show_screen until the main window is visible again.
+        
+        Returns True if the request was deferred. Only the latest request is
+        kept, so several clicks while hidden collapse into a single build.
+        """
+        if self.root.winfo_viewable():
+            return False
+        self._pending_screen = show_screen
+        return True
+
+    def _on_root_map(self, event):
+        """Show the screen requested while the window was hidden."""
+        # <Map> on the root tag also fires for every child widget that is mapped
+        if event.widget is not self.root or self._pending_screen is None:
+            return
+        show_screen = self._pending_screen
+        self._pending_screen = None
+        show_screen()
+
     def change_theme(self, theme_name: str):
+        """Switch to theme_name and re-color only what depends on the colors that changed."""
+        if theme_name == self.theme_manager.current_theme:
+            return
+        
+        previous = self.theme
         self.theme = self.theme_manager.set_theme(theme_name)
-        self.update_ui_theme()
+        changed_keys = self.theme_manager.changed_keys(previous, self.theme)
+        if not changed_keys:
+            return
+        
+        self._refresh_theme_cache()
+        self.update_ui_theme(changed_keys)
 
-    def update_ui_theme(self):
-        """Update UI elements with the current theme."""
+    def _refresh_theme_cache(self):
+        """Materialize the theme colors used while building screens as plain attributes."""
+        theme = self.theme
+        self._c_bg = theme.get("bg", "#F0F4F8")
+        self._c_fg = theme.get("fg", "#DDE4E6")
+        self._c_text = theme.get("text", "#1E293B")
+        self._c_accent = theme.get("accent", "#4C51BF")
+        self._c_button = theme.get("button", "#4C51BF")
+        self._c_button_hover = theme.get("button_hover", "#3C41AF")
+        self._c_primary = theme.get("primary", "#4C51BF")
+        self._c_primary_hover = theme.get("primary_hover", "#3C41AF")
+        self._c_secondary = theme.get("secondary", "#64748B")
+        self._c_secondary_hover = theme.get("secondary_hover", "#475569")
+
+    def update_ui_theme(self, changed_keys=None):
+        """Update UI elements with the current theme.
+        
+        changed_keys lists the theme keys that differ from the previous theme and is
+        passed on so each widget can skip itself; None updates everything.
+        """
         try:
             # Skip theme updates completely if shutting down
             if getattr(self, 'is_shutting_down', False):
@@ -279,246 +586,190 @@ class NumericalApp:
                     self.root.after_cancel(self.after_ids["update_ui_theme"])
                     del self.after_ids["update_ui_theme"]
                 except Exception as e:
-                    self.logger.debug(f"Error canceling update_ui_theme callback: {e}")
+                    logger.debug("Error canceling update_ui_theme callback: %s", e)
+            
+            def changed(*keys):
+                return changed_keys is None or not changed_keys.isdisjoint(keys)
             
             # Update the main window background
-            self.root.configure(fg_color=self.theme.get("bg", "#F0F4F8"))
+            if changed("bg"):
+                self.root.configure(fg_color=self._c_bg)
             
             # Update the sidebar if it exists
             if hasattr(self, "sidebar") and self.sidebar is not None:
                 try:
-                    self.sidebar.update_theme(self.theme)
-                except Exception as sidebar_error:
-                    self.logger.error(f"Error updating sidebar theme: {str(sidebar_error)}")
+                    self.sidebar.update_theme(self.theme, changed_keys)
+                except Exception:
+                    logger.exception("Error updating sidebar theme")
             
             # Update tables if they exist
             if hasattr(self, "result_table") and self.result_table is not None:
                 try:
-                    self.result_table.update_theme(self.theme)
-                except Exception as table_error:
-                    self.logger.error(f"Error updating result table theme: {str(table_error)}")
+                    self.result_table.update_theme(self.theme, changed_keys)
+                except Exception:
+                    logger.exception("Error updating result table theme")
                     
             if hasattr(self, "history_table") and self.history_table is not None:
                 try:
-                    self.history_table.update_theme(self.theme)
-                except Exception as table_error:
-                    self.logger.error(f"Error updating history table theme: {str(table_error)}")
+                    self.history_table.update_theme(self.theme, changed_keys)
+                except Exception:
+                    logger.exception("Error updating history table theme")
                     
             # Update forms if they exist
             if hasattr(self, "input_form") and self.input_form is not None:
                 try:
-                    self.input_form.update_theme(self.theme)
-                except Exception as form_error:
-                    self.logger.error(f"Error updating input form theme: {str(form_error)}")
+                    self.input_form.update_theme(self.theme, changed_keys)
+                except Exception:
+                    logger.exception("Error updating input form theme")
+            
+            # Re-color the registered screen widgets, one list and one option set per kind;
+            # each configure redraws a CTk canvas, so kinds whose colors did not change are skipped
+            if changed("bg"):
+                self._theme_frames = self._configure_live(self._theme_frames, fg_color=self._c_bg)
+            if changed("text"):
+                self._theme_labels = self._configure_live(self._theme_labels, text_color=self._c_text)
+            if changed("button", "button_hover"):
+                self._theme_buttons = self._configure_live(
+                    self._theme_buttons, fg_color=self._c_button, hover_color=self._c_button_hover
+                )
+            if changed("primary", "primary_hover"):
+                self._theme_primary_buttons = self._configure_live(
+                    self._theme_primary_buttons, fg_color=self._c_primary, hover_color=self._c_primary_hover
+                )
                 
             # Configure the Table Style
             self.configure_table_style()
                 
-        except Exception as e:
+        except Exception:
             # Only log error if not shutting down
             if not getattr(self, 'is_shutting_down', False):
-                self.logger.error(f"Error updating UI theme: {str(e)}")
+                logger.exception("Error updating UI theme")
+
+    @staticmethod
+    def _configure_live(widgets, **options):
+        """Configure each widget with options; return the widgets that still exist."""
+        live = []
+        for widget in widgets:
+            try:
+                widget.configure(**options)
+                live.append(widget)
+            except tk.TclError:
+                pass
+        return live
 
+    @_screen("home", "Error loading home screen")
     def show_home(self):
-        """Display the home screen with input form and results table."""
-        try:
-            self.clear_content()
-            
-            # Create a canvas and scrollbar for scrolling
-            canvas = ctk.CTkCanvas(self.content_frame, bg=self.theme.get("bg", "#F0F4F8"), highlightthickness=0)
-            scrollbar = ttk.Scrollbar(self.content_frame, orient="vertical", command=canvas.yview)
-            
-            # Create the main frame that will be scrolled
-            home_frame = ctk.CTkFrame(canvas, fg_color=self.theme.get("bg", "#F0F4F8"))
-            
-            # Configure the canvas
-            canvas.configure(yscrollcommand=scrollbar.set)
-            
-            # Pack the scrollbar and canvas
-            scrollbar.pack(side="right", fill="y")
-            canvas.pack(side="left", fill="both", expand=True)
-            
-            # Create a window in the canvas for the frame
-            canvas_window = canvas.create_window((0, 0), window=home_frame, anchor="nw", width=canvas.winfo_width())
-            
-            # Update the scroll region when the frame changes size
-            def configure_scroll_region(event):
-                canvas.configure(scrollregion=canvas.bbox("all"))
-            
-            home_frame.bind("<Configure>", configure_scroll_region)
-            
-            # Update the canvas window width when the canvas is resized
-            def configure_canvas_window(event):
-                canvas.itemconfig(canvas_window, width=event.width)
-            
-            canvas.bind("<Configure>", configure_canvas_window)
-            
-            # Add mousewheel scrolling
-            def _on_mousewheel(event):
-                """Handle mouse wheel scrolling with improved cross-platform support."""
-                try:
-                    # Quick validation of event and widgets
-                    if not canvas.winfo_exists():
-                        return
-                        
-                    # Use a safer method to get widget attributes
-                    try:
-                        # Get current scroll position to detect boundaries
-                        current_pos = canvas.yview()
-                        
-                        # Calculate appropriate scroll amount based on platform detection
-                        scroll_amount = 0
-                        
-                        # Windows (delta is typically multiples of 120)
-                        if hasattr(event, "delta") and abs(event.delta) >= 120:
-                            # Scale for smoother scrolling
-                            scroll_factor = 2  # Adjust for smoother scrolling
-                            scroll_amount = -1 * (event.delta // (120 / scroll_factor))
-                        
-                        # macOS (delta with smaller values)
-                        elif hasattr(event, "delta") and abs(event.delta) < 20:
-                            scroll_amount = -1 * event.delta
-                        
-                        # Linux/Unix (Button-4/Button-5)
-                        elif hasattr(event, "num"):
-                            if event.num == 4:
-                                scroll_amount = -1
-                            elif event.num == 5:
-                                scroll_amount = 1
-                        
-                        # Apply the scroll if amount is non-zero and canvas still exists
-                        if scroll_amount != 0 and canvas.winfo_exists():
-                            canvas.yview_scroll(int(scroll_amount), "units")
-                            
-                            # Check if we hit an edge (view didn't change despite scroll attempt)
-                            new_pos = canvas.yview()
-                            if new_pos == current_pos and scroll_amount != 0:
-                                # At edge of scrolling - allow propagation to parent
-                                return
-                            else:
-                                # Scrolled successfully - prevent further propagation
-                                return "break"
-                    except Exception as e:
-                        # Handle attribute access errors silently
-                        self.logger.debug(f"Scroll attribute error (non-critical): {str(e)}")
-                        return
-                        
-                except Exception as e:
-                    # Log but don't disrupt user experience
-                    self.logger.debug(f"Scroll handling error (non-critical): {str(e)}")
-                
-                # Allow event to propagate if not handled
-                return
-            
-            # Directly bind to relevant widgets - more targeted approach
-            canvas.bind("<MouseWheel>", _on_mousewheel)
-            canvas.bind("<Button-4>", _on_mousewheel)
-            canvas.bind("<Button-5>", _on_mousewheel)
-            
-            # Bind scrolling to the home frame as well
-            home_frame.bind("<MouseWheel>", _on_mousewheel)
-            home_frame.bind("<Button-4>", _on_mousewheel)
-            home_frame.bind("<Button-5>", _on_mousewheel)
-            
-            # Create a label for the home screen
-            home_label = ctk.CTkLabel(
-                home_frame,
-                text="Numerical Analysis Calculator",
-                font=ctk.CTkFont(size=24, weight="bold"),
-                text_color=self.theme.get("text", "#1E293B")
-            )
-            home_label.pack(pady=(10, 10))
-            
-            # Create the input form with the correct parameters
-            from src.ui.widgets.input_form import InputForm
-            self.input_form = InputForm(
-                home_frame, 
-                self.theme, 
-                list(self.solver.methods.keys()), 
-                self.solve
-            )
-            self.input_form.frame.pack(fill="x", padx=10, pady=10)
-            
-            # Create layout containers
-            main_content = ctk.CTkFrame(home_frame, fg_color=self.theme.get("bg", "#F0F4F8"))
-            main_content.pack(fill="both", expand=True, padx=10, pady=5)
-            
-            # Create a container frame for the table that fills most of the screen
-            table_container = ctk.CTkFrame(main_content, fg_color=self.theme.get("bg", "#F0F4F8"), height=450)
-            table_container.pack(fill="both", expand=True, side="top", padx=2, pady=2)
-            table_container.pack_propagate(False)  # Prevent container from resizing
-            
-            # Create the results table with fixed_position=True
-            self.result_table = ResultTable(table_container, self.theme, height=450, fixed_position=True)
-            self.result_table.table_frame.pack(fill="both", expand=True)
-            
-            # Create a frame for the result to give it a distinct appearance
-            result_container = ctk.CTkFrame(
-                main_content,
-                fg_color=self.theme.get("primary_light", "#EFF6FF"),
-                corner_radius=4,  # Reduced from 6
-                border_width=1,
-                border_color=self.theme.get("border", "#CBD5E1")
-            )
-            result_container.pack(fill="x", padx=5, pady=(3, 5))  # Reduced padding
-            
-            # Create a label for displaying the result
-            self.result_label = ctk.CTkLabel(
-                result_container,
-                text="",
-                font=ctk.CTkFont(size=14, weight="bold"),  # Reduced font size from 16 to 14
-                text_color=self.theme.get("primary", "#3B82F6")
-            )
-            self.result_label.pack(pady=5)  # Reduced from 8 to 5
-            
-            # Add a frame for the plot with sufficient height but reduced padding
-            self.plot_frame = ctk.CTkFrame(main_content, fg_color=self.theme.get("bg", "#F0F4F8"), height=350)
-            self.plot_frame.pack(fill="both", expand=True, padx=2, pady=5)  # Reduced padding
-            self.plot_frame.pack_propagate(False)  # Prevent plot frame from shrinking
-            
-            # Add a placeholder label for the plot
-            self.plot_label = ctk.CTkLabel(
-                self.plot_frame,
-                text="Function plot will appear here after solving",
-                font=ctk.CTkFont(size=14),
-                text_color=self.theme.get("text", "#1E293B")
-            )
-            self.plot_label.pack(pady=20)
-            
-            # Handle plot frame mouse events - prevent scrolling when mouse is over the plot
-            self.plot_frame.unbind("<MouseWheel>")
-            self.plot_frame.unbind("<Button-4>")
-            self.plot_frame.unbind("<Button-5>")
-            
-            # Add buttons container
-            buttons_frame = ctk.CTkFrame(home_frame, fg_color=self.theme.get("bg", "#F0F4F8"))
-            buttons_frame.pack(fill="x", padx=10, pady=5)
-            
-            # Add an export button
-            export_button = ctk.CTkButton(
-                buttons_frame,
-                text="Export to PDF",
-                command=self.export_solution,
-                fg_color=self.theme.get("button", "#3B82F6"),
-                hover_color=self.theme.get("button_hover", "#2563EB"),
-                text_color="white",
-                font=ctk.CTkFont(size=14, weight="bold")
-            )
-            export_button.pack(side="left", padx=10, pady=10, expand=True)
-            
-        except Exception as e:
-            self.logger.error(f"Error showing home screen: {str(e)}")
-            # Create a basic error display if the home frame creation fails
-            error_frame = ctk.CTkFrame(self.content_frame, fg_color=self.theme.get("bg", "#F0F4F8"))
-            error_frame.pack(fill="both", expand=True, padx=10, pady=10)
-            
-            error_label = ctk.CTkLabel(
-                error_frame,
-                text=f"Error loading home screen: {str(e)}",
-                text_color="red",
-                font=ctk.CTkFont(size=14)
-            )
-            error_label.pack(pady=10)
+        """Display the home screen, building it on the first visit."""
+        self._show_screen("home", self._build_home, padding=0)
+
+    def _build_home(self):
+        """Build the home widget tree once; the input form, results and plot persist across visits."""
+        # Theme colors used throughout this builder
+        bg_color = self._c_bg
+        text_color = self._c_text
+        button_color = self._c_button
+        button_hover_color = self._c_button_hover
+        primary_color = self._c_primary
+        primary_light_color = self.theme.get("primary_light", "#EFF6FF")
+        border_color = self.theme.get("border", "#CBD5E1")
+        
+        # Root frame that holds the whole screen so it can be detached and re-attached
+        home_root = ctk.CTkFrame(self.content_frame, fg_color=bg_color)
+        
+        # CustomTkinter's scrollable frame handles the scroll region, width and mouse wheel itself
+        home_frame = ctk.CTkScrollableFrame(home_root, fg_color=bg_color)
+        home_frame.pack(fill="both", expand=True)
+        
+        # Create a label for the home screen
+        home_label = ctk.CTkLabel(
+            home_frame,
+            text="Numerical Analysis Calculator",
+            font=self._fonts["title"],
+            text_color=text_color
+        )
+        home_label.pack(pady=(10, 10))
+        
+        # Create the input form with the correct parameters
+        from src.ui.widgets.input_form import InputForm
+        self.input_form = InputForm(
+            home_frame, 
+            self.theme, 
+            self._method_names, 
+            self.solve
+        )
+        self.input_form.frame.pack(fill="x", padx=10, pady=10)
+        
+        # Create layout containers
+        main_content = ctk.CTkFrame(home_frame, fg_color=bg_color)
+        main_content.pack(fill="both", expand=True, padx=10, pady=5)
+        
+        # Create a container frame for the table that fills most of the screen
+        table_container = ctk.CTkFrame(main_content, fg_color=bg_color, height=450)
+        table_container.pack(fill="both", expand=True, side="top", padx=2, pady=2)
+        table_container.pack_propagate(False)  # Prevent container from resizing
+        
+        # Create the results table with fixed_position=True
+        self.result_table = ResultTable(table_container, self.theme, theme_manager=self.theme_manager, height=450, fixed_position=True)
+        self.result_table.table_frame.pack(fill="both", expand=True)
+        
+        # Create a frame for the result to give it a distinct appearance
+        result_container = ctk.CTkFrame(
+            main_content,
+            fg_color=primary_light_color,
+            corner_radius=4,  # Reduced from 6
+            border_width=1,
+            border_color=border_color
+        )
+        result_container.pack(fill="x", padx=5, pady=(3, 5))  # Reduced padding
+        
+        # Create a label for displaying the result
+        self.result_label = ctk.CTkLabel(
+            result_container,
+            text="",
+            font=self._fonts["btn"],  # Reduced font size from 16 to 14
+            text_color=primary_color
+        )
+        self.result_label.pack(pady=5)  # Reduced from 8 to 5
+        
+        # Add a frame for the plot with sufficient height but reduced padding
+        self._register("plot_frame", ctk.CTkFrame(main_content, fg_color=bg_color, height=350))
+        self.plot_frame.pack(fill="both", expand=True, padx=2, pady=5)  # Reduced padding
+        self.plot_frame.pack_propagate(False)  # Prevent plot frame from shrinking
+        
+        # Add a placeholder label for the plot
+        self.plot_label = ctk.CTkLabel(
+            self.plot_frame,
+            text="Function plot will appear here after solving",
+            font=self._fonts["body"],
+            text_color=text_color
+        )
+        self.plot_label.pack(pady=20)
+        
+        # Handle plot frame mouse events - prevent scrolling when mouse is over the plot
+        self.plot_frame.unbind("<MouseWheel>")
+        self.plot_frame.unbind("<Button-4>")
+        self.plot_frame.unbind("<Button-5>")
+        
+        # Add buttons container
+        buttons_frame = ctk.CTkFrame(home_frame, fg_color=bg_color)
+        buttons_frame.pack(fill="x", padx=10, pady=5)
+        
+        # Add an export button
+        export_button = ctk.CTkButton(
+            buttons_frame,
+            text="Export to PDF",
+            command=self.export_solution,
+            fg_color=button_color,
+            hover_color=button_hover_color,
+            text_color="white",
+            font=self._fonts["btn"]
+        )
+        export_button.pack(padx=10, pady=10)
+        
+        self._theme_frames.extend([home_root, home_frame, main_content, table_container, self.plot_frame, buttons_frame])
+        self._theme_labels.extend([home_label, self.plot_label])
+        self._theme_buttons.append(export_button)
+        self._screens["home"] = home_root
 
     def _round_value(self, value, decimal_places):
         """Round a value to the specified number of decimal places"""
@@ -539,9 +790,9 @@ class NumericalApp:
         if getattr(self, 'is_shutting_down', False):
             return
         
-        # Clear previous results
+        # Replace previous results with a progress note until the worker thread reports back
         if hasattr(self, 'result_label'):
-            self.result_label.configure(text="")
+            self.result_label.configure(text="Calculating...")
         
         # Clear previous plot
         if hasattr(self, 'plot_frame'):
@@ -552,7 +803,7 @@ class NumericalApp:
                         self.root.after_cancel(self.after_ids[after_id_name])
                         del self.after_ids[after_id_name]
                     except Exception as e:
-                        self.logger.debug(f"Error canceling {after_id_name}: {e}")
+                        logger.debug("Error canceling %s: %s", after_id_name, e)
             
             # Clear the placeholder
             for widget in self.plot_frame.winfo_children():
@@ -563,15 +814,15 @@ class NumericalApp:
         
         # Create a progress frame
         if hasattr(self, 'plot_frame'):
-            progress_frame = ctk.CTkFrame(self.plot_frame, fg_color=self.theme.get("bg", "#F0F4F8"))
+            progress_frame = ctk.CTkFrame(self.plot_frame, fg_color=self._c_bg)
             progress_frame.pack(fill="both", expand=True, padx=20, pady=20)
             
             # Add a label
             progress_label = ctk.CTkLabel(
                 progress_frame,
                 text=f"Calculating...",
-                font=ctk.CTkFont(size=16, weight="bold"),
-                text_color=self.theme.get("text", "#1E293B")
+                font=self._fonts["subheading"],
+                text_color=self._c_text
             )
             progress_label.pack(pady=(20, 10))
             
@@ -582,7 +833,7 @@ class NumericalApp:
                 mode="indeterminate",
                 determinate_speed=0.5,
                 indeterminate_speed=1,
-                progress_color=self.theme.get("accent", "#3B82F6")
+                progress_color=self._c_accent
             )
             progress_bar.pack(pady=10)
             progress_bar.start()
@@ -592,8 +843,8 @@ class NumericalApp:
             method_label = ctk.CTkLabel(
                 progress_frame,
                 text=f"Method: {method_name}",
-                font=ctk.CTkFont(size=14),
-                text_color=self.theme.get("text", "#1E293B")
+                font=self._fonts["body"],
+                text_color=self._c_text
             )
             method_label.pack(pady=5)
             
@@ -602,8 +853,8 @@ class NumericalApp:
                 progress_frame,
                 text="Cancel",
                 command=self._cancel_calculation,
-                fg_color=self.theme.get("button", "#3B82F6"),
-                hover_color=self.theme.get("button_hover", "#2563EB"),
+                fg_color=self._c_button,
+                hover_color=self._c_button_hover,
                 width=100
             )
             cancel_button.pack(pady=15)
@@ -617,117 +868,77 @@ class NumericalApp:
         # Set calculation active flag
         with self.calculation_lock:
             self.calculation_active = True
-            
-        # Extract parameters from kwargs for info display
-        f_str = kwargs.get('f_str', '')
-        method = kwargs.get('method', '')
         
-        # Only use threading for matrix methods or when solving large systems
-        use_threading = method in [
-            "Gauss Elimination", "Gauss-Jordan", "LU Decomposition", "Cramer's Rule", 
-            "Gauss Elimination (Partial Pivoting)", "LU Decomposition (Partial Pivoting)",
-            "Gauss-Jordan (Partial Pivoting)"
-        ]
+        # Extract parameters on the Tk thread; the worker only runs the solver
+        f_str = self.solve_params.get('f_str', '')
+        method = self.solve_params.get('method', '')
+        params = self.solve_params.get('params', {})
+        eps = self.solve_params.get('eps', None)
+        eps_operator = self.solve_params.get('eps_operator', "<=")
+        max_iter = self.solve_params.get('max_iter', None)
+        stop_by_eps = self.solve_params.get('stop_by_eps', None)
+        decimal_places = self.solve_params.get('decimal_places', None)
         
-        # Also use threading for high iteration counts in iterative methods
-        max_iter = kwargs.get('max_iter', 0)
-        if isinstance(max_iter, (int, float)) and max_iter > 100:
-            use_threading = True
+        # The worker puts exactly one ("result" | "error", payload) item here
+        results = queue.Queue(maxsize=1)
         
-        # Define function to run in thread
+        # Define function to run in thread; it must not call Tk, which is not thread-safe
         def calculation_thread():
             try:
-                # Check if calculation is still active
-                with self.calculation_lock:
-                    if not self.calculation_active or self.is_shutting_down:
-                        return
-                
-                    # Extract parameters from kwargs
-                    f_str = self.solve_params.get('f_str', '')
-                    method = self.solve_params.get('method', '')
-                    params = self.solve_params.get('params', {})
-                    eps = self.solve_params.get('eps', None)
-                    eps_operator = self.solve_params.get('eps_operator', "<=")
-                    max_iter = self.solve_params.get('max_iter', None)
-                    stop_by_eps = self.solve_params.get('stop_by_eps', None)
-                    decimal_places = self.solve_params.get('decimal_places', None)
-                
-                # Store a local copy of calculation_active
-                is_active = True
-                
-                # Solve the problem (outside the lock to avoid deadlocks)
                 result, table_data = self.solver.solve(method, f_str, params, eps, eps_operator, max_iter, stop_by_eps, decimal_places)
-                
-                # Check if calculation is still active before updating UI
-                with self.calculation_lock:
-                    is_active = self.calculation_active and not self.is_shutting_down
-                
-                # Post the results back to the main thread if calculation is still active
-                if is_active and not self.is_shutting_down and hasattr(self, 'root') and self.root.winfo_exists():
-                    self.safe_after(0, lambda: self._process_solve_result(result, table_data, method, f_str, decimal_places))
-                    
+                results.put(("result", (result, table_data)))
             except Exception as e:
-                self.logger.error(f"Error in calculation thread: {str(e)}")
-                
-                # Check if app is still running before showing error
-                if not self.is_shutting_down and hasattr(self, 'root') and self.root.winfo_exists():
-                    with self.calculation_lock:
-                        is_active = self.calculation_active
-                    
-                    if is_active:
-                        self.safe_after(0, lambda: self._show_calculation_error(str(e)))
-                    
-            finally:
-                # Release the lock and update calculation status
-                with self.calculation_lock:
-                    self.calculation_active = False
-        
-        # Run calculation in thread if needed, otherwise directly
-        if use_threading:
-            # Create and start a new thread
-            self.calculation_thread = threading.Thread(target=calculation_thread)
-            self.calculation_thread.daemon = True  # Daemon thread will be killed when main thread exits
-            self.calculation_thread.start()
+                logger.exception("Error in calculation thread")
+                results.put(("error", str(e)))
+        
+        # Always solve off the Tk thread so the event loop keeps running;
+        # _poll_solve picks the outcome up on the Tk thread
+        self.calculation_thread = threading.Thread(target=calculation_thread)
+        self.calculation_thread.daemon = True  # Daemon thread will be killed when main thread exits
+        self.calculation_thread.start()
+        self._poll_solve(results, method, f_str, decimal_places)
+    
+    def _poll_solve(self, results, method, f_str, decimal_places):
+        """Show the calculation thread's outcome once it is queued; poll again until then."""
+        try:
+            kind, payload = results.get_nowait()
+        except queue.Empty:
+            # Reusing the name cancels the poll of an earlier solve, so its late outcome is dropped
+            self.safe_after(50, lambda: self._poll_solve(results, method, f_str, decimal_places), "solve_poll")
+            return
+        
+        with self.calculation_lock:
+            is_active = self.calculation_active
+            self.calculation_active = False
+        
+        # A canceled calculation has already replaced the progress display
+        if not is_active:
+            return
+        
+        if kind == "error":
+            self._show_calculation_error(payload)
         else:
-            # For simpler calculations, run directly
-            try:
-                # Extract parameters from kwargs
-                f_str = kwargs.get('f_str', '')
-                method = kwargs.get('method', '')
-                params = kwargs.get('params', {})
-                eps = kwargs.get('eps', None)
-                eps_operator = kwargs.get('eps_operator', "<=")
-                max_iter = kwargs.get('max_iter', None)
-                stop_by_eps = kwargs.get('stop_by_eps', None)
-                decimal_places = kwargs.get('decimal_places', None)
-                
-                # Solve the problem
-                result, table_data = self.solver.solve(method, f_str, params, eps, eps_operator, max_iter, stop_by_eps, decimal_places)
-                
-                # Process the result directly
-                self._process_solve_result(result, table_data, method, f_str, decimal_places)
-            except Exception as e:
-                self.logger.error(f"Error solving problem: {str(e)}")
-                self._show_calculation_error(str(e))
+            result, table_data = payload
+            self._process_solve_result(result, table_data, method, f_str, decimal_places)
     
     def _cancel_calculation(self):
         """Cancel the current calculation."""
         # We can't actually interrupt a thread in Python safely,
         # but we can set a flag to indicate the calculation should stop
-        self.logger.info("User canceled calculation")
+        logger.info("User canceled calculation")
         
         # Mark calculation as inactive so thread knows to stop
         with self.calculation_lock:
             self.calculation_active = False
         
         # Clean up UI safely
-        if not self.is_shutting_down and hasattr(self, 'root') and self.root.winfo_exists() and hasattr(self, 'plot_frame'):
+        if not self.is_shutting_down and hasattr(self, 'root') and self.root.winfo_exists() and getattr(self, 'plot_frame_alive', False):
             # Clear the plot frame
             for widget in self.plot_frame.winfo_children():
                 try:
                     widget.destroy()
                 except Exception as e:
-                    self.logger.debug(f"Error destroying widget: {e}")
+                    logger.debug("Error destroying widget: %s", e)
                     pass
             
             # Show canceled message
@@ -735,12 +946,12 @@ class NumericalApp:
                 canceled_label = ctk.CTkLabel(
                     self.plot_frame,
                     text="Calculation canceled",
-                    font=ctk.CTkFont(size=16, weight="bold"),
-                    text_color=self.theme.get("text", "#1E293B")
+                    font=self._fonts["subheading"],
+                    text_color=self._c_text
                 )
                 canceled_label.pack(pady=20)
             except Exception as e:
-                self.logger.debug(f"Error showing canceled message: {e}")
+                logger.debug("Error showing canceled message: %s", e)
     
     def _show_calculation_error(self, error_message):
         """Show calculation error in the UI."""
@@ -754,6 +965,18 @@ class NumericalApp:
         # Show error in plot area
         self._show_plot_error(f"Error: {error_message}")
     
+    @staticmethod
+    def _format_solution_vector(vector, decimal_places):
+        """Format a solution vector as "x1=..., x2=...", rounding all values in one NumPy call."""
+        values = list(vector)
+        if decimal_places is not None:
+            try:
+                values = np.round(np.asarray(values, dtype=float), decimal_places).tolist()
+            except (TypeError, ValueError):
+                # Leave non-numeric entries as they are
+                pass
+        return ", ".join(f"x{i}={val}" for i, val in enumerate(values, 1))
+
     def _process_solve_result(self, result, table_data, method, f_str, decimal_places):
         """Process and display the solution result in the UI."""
         try:
@@ -848,9 +1071,6 @@ class NumericalApp:
                             # Add the result row to the table data
                             table_data.append(final_result_row)
                 
-                # Display the result in the table
-                self.result_table.display(table_data)
-                
                 # For matrix methods, add a solution summary row to both result label and result table if needed
                 if method in ["Gauss Elimination", "Gauss-Jordan", "LU Decomposition", "Cramer's Rule", 
                               "Gauss Elimination (Partial Pivoting)", "LU Decomposition (Partial Pivoting)",
@@ -860,12 +1080,7 @@ class NumericalApp:
                         solution_vector = result if isinstance(result, list) else result[0]
                         
                         # Format the solution for display
-                        solution_str = ""
-                        for i, val in enumerate(solution_vector):
-                            if decimal_places is not None and isinstance(val, (int, float)):
-                                val = round(val, decimal_places)
-                            solution_str += f"x{i+1}={val}, "
-                        solution_str = solution_str.rstrip(", ")
+                        solution_str = self._format_solution_vector(solution_vector, decimal_places)
                         
                         # Add a summary row to the table with the solution vector
                         if isinstance(table_data, list) and len(table_data) > 0:
@@ -874,9 +1089,9 @@ class NumericalApp:
                             
                             # Add the row to the table data
                             table_data.append(summary_row)
-                            
-                            # Refresh the table display with the updated data
-                            self.result_table.display(table_data)
+                
+                # Display the result in the table once, including any summary row
+                self.result_table.display(table_data)
                 
                 # Display the result
                 if hasattr(self, 'result_label'):
@@ -901,12 +1116,7 @@ class NumericalApp:
                             root_message = f"Root found: {result}"
                         elif isinstance(result, list):
                             # Handle matrix solution (list of values)
-                            solution_str = "Solution: "
-                            for i, val in enumerate(result):
-                                if decimal_places is not None and isinstance(val, (int, float)):
-                                    val = round(val, decimal_places)
-                                solution_str += f"x{i+1}={val}, "
-                            root_message = solution_str.rstrip(", ")
+                            root_message = "Solution: " + self._format_solution_vector(result, decimal_places)
                         elif isinstance(result, tuple) and len(result) > 0:
                             # Tuple with root as first element (like in Bisection, False Position, etc.)
                             if result[0] is not None and isinstance(result[0], (int, float)):
@@ -917,12 +1127,7 @@ class NumericalApp:
                                 root_message = f"Root found: {root_value}"
                             elif result[0] is not None and isinstance(result[0], list):
                                 # First element is a list (solution vector)
-                                solution_str = "Solution: "
-                                for i, val in enumerate(result[0]):
-                                    if decimal_places is not None and isinstance(val, (int, float)):
-                                        val = round(val, decimal_places)
-                                    solution_str += f"x{i+1}={val}, "
-                                root_message = solution_str.rstrip(", ")
+                                root_message = "Solution: " + self._format_solution_vector(result[0], decimal_places)
                     
                     self.result_label.configure(text=root_message)
             
@@ -937,13 +1142,13 @@ class NumericalApp:
                                                                       "Cramer's Rule", "Gauss Elimination (Partial Pivoting)", 
                                                                       "LU Decomposition (Partial Pivoting)", "Gauss-Jordan (Partial Pivoting)"]:
                     # Hide the plot frame
-                    if hasattr(self, 'plot_frame') and self.plot_frame.winfo_exists():
+                    if getattr(self, 'plot_frame_alive', False):
                         self.plot_frame.pack_forget()  # Remove plot frame from display
                     # Exit early - don't try to create a plot
                     return result
                 else:
                     # For non-matrix methods, make sure plot frame is visible
-                    if hasattr(self, 'plot_frame') and self.plot_frame.winfo_exists():
+                    if getattr(self, 'plot_frame_alive', False):
                         self.plot_frame.pack(fill="both", expand=True, padx=5, pady=5)
                 
                 # Continue with normal plot creation code
@@ -961,7 +1166,7 @@ class NumericalApp:
                 if f_str and f_str != "System of Linear Equations" and root_value is not None:
                     try:
                         # Log before attempting to create plot
-                        self.logger.info(f"Attempting to create plot for function: {f_str} with root: {root_value}")
+                        logger.info("Attempting to create plot for function: %s with root: %s", f_str, root_value)
                         
                         import matplotlib.pyplot as plt
                         import numpy as np
@@ -1085,7 +1290,7 @@ class NumericalApp:
                                                    ha='center')
                             
                             except Exception as e:
-                                self.logger.warning(f"Error plotting iteration points: {str(e)}")
+                                logger.warning("Error plotting iteration points: %s", e)
                             
                             # Add a horizontal line at y=0
                             ax.axhline(y=0, color='k', linestyle='-', alpha=0.3)
@@ -1110,7 +1315,7 @@ class NumericalApp:
                                 ax.set_xlim(plot_min, plot_max)
                             
                             # Use FigureCanvasTkAgg
-                            plot_frame = ctk.CTkFrame(self.plot_frame, fg_color=self.theme.get("bg", "#F0F4F8"))
+                            plot_frame = ctk.CTkFrame(self.plot_frame, fg_color=self._c_bg)
                             plot_frame.pack(fill="both", expand=True)
                             
                             canvas = FigureCanvasTkAgg(fig, master=plot_frame)
@@ -1128,15 +1333,15 @@ class NumericalApp:
                             }
                             
                             # Log that the plot was successfully created
-                            self.logger.info("Plot created successfully")
+                            logger.info("Plot created successfully")
                         else:
                             self._show_plot_error("Could not generate valid function values for plotting")
                     except Exception as e:
-                        self.logger.error(f"Error creating plot: {str(e)}")
+                        logger.exception("Error creating plot")
                         self._show_plot_error(f"Error creating plot: {str(e)}")
                 elif f_str == "System of Linear Equations":
                     # For matrix methods, hide the plot frame completely
-                    if hasattr(self, 'plot_frame') and self.plot_frame.winfo_exists():
+                    if getattr(self, 'plot_frame_alive', False):
                         self.plot_frame.pack_forget()  # Remove plot frame from display
                     # Exit early - don't try to create a plot
                     return result
@@ -1151,7 +1356,7 @@ class NumericalApp:
             return result
             
         except Exception as e:
-            self.logger.error(f"Error processing solution result: {str(e)}")
+            logger.exception("Error processing solution result")
             self._show_calculation_error(str(e))
             return None
     
@@ -1165,7 +1370,7 @@ class NumericalApp:
                              "Cramer's Rule", "Gauss Elimination (Partial Pivoting)", 
                              "LU Decomposition (Partial Pivoting)", "Gauss-Jordan (Partial Pivoting)"]:
                     # For matrix methods, hide the plot frame completely
-                    if hasattr(self, 'plot_frame') and self.plot_frame.winfo_exists():
+                    if getattr(self, 'plot_frame_alive', False):
                         self.plot_frame.pack_forget()  # Remove plot frame from display
                     return
             
@@ -1178,1268 +1383,1024 @@ class NumericalApp:
                         pass
                 
                 # Make sure plot frame is visible
-                if hasattr(self, 'plot_frame') and self.plot_frame.winfo_exists():
+                if getattr(self, 'plot_frame_alive', False):
                     self.plot_frame.pack(fill="both", expand=True, padx=5, pady=5)
                 
                 # Add an error label
                 error_label = ctk.CTkLabel(
                     self.plot_frame,
                     text=message,
-                    font=ctk.CTkFont(size=14),
+                    font=self._fonts["body"],
                     text_color="red"
                 )
                 error_label.pack(pady=20)
-        except Exception as e:
-            self.logger.error(f"Error showing plot error: {str(e)}")
+        except Exception:
+            logger.exception("Error showing plot error")
 
     def export_solution(self):
         if hasattr(self, "last_solution"):
             try:
                 func, method, root, table_data = self.last_solution
+                if self._export_fn is None:
+                    from src.utils.export import export_to_pdf
+                    self._export_fn = export_to_pdf
                 from datetime import datetime
                 filename = f"solution_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-                export_to_pdf(filename, func, method, root, table_data)
+                self._export_fn(filename, func, method, root, table_data)
                 self.result_label.configure(text=f"Exported to {filename}")
             except Exception as e:
-                self.logger.error(f"Error exporting solution: {str(e)}")
+                logger.exception("Error exporting solution")
                 self.result_label.configure(text=f"Export error: {str(e)}")
 
     def clear_content(self):
         """Clear all widgets from the content frame."""
         try:
-            if hasattr(self, "content_frame") and self.content_frame.winfo_exists():
-                # First cancel any after callbacks that might reference these widgets
+            if getattr(self, "content_frame_alive", False):
+                # Hide any transient message before its parent is detached or destroyed
+                self._flush_toast()
+                self._current_screen = ""
+                
+                # First cancel any after callbacks that might reference these widgets.
+                # Cached screens survive, so their pending callbacks stay valid.
                 for after_id_name in list(self.after_ids.keys()):
-                    if "settings" in after_id_name or "history" in after_id_name:
+                    if "settings" in after_id_name:
                         try:
                             self.root.after_cancel(self.after_ids[after_id_name])
                             del self.after_ids[after_id_name]
                         except Exception as e:
-                            self.logger.debug(f"Error canceling {after_id_name}: {e}")
+                            logger.debug("Error canceling %s: %s", after_id_name, e)
                 
-                # Destroy all widgets in the content frame
-                for widget in self.content_frame.winfo_children():
-                    if widget.winfo_exists():
-                        widget.destroy()
-                        
-                # Reset references to content-specific widgets
-                if hasattr(self, "input_form"):
-                    delattr(self, "input_form")
-                if hasattr(self, "result_table"):
-                    delattr(self, "result_table")
-                if hasattr(self, "result_label"):
-                    delattr(self, "result_label")
-                if hasattr(self, "history_table"):
-                    delattr(self, "history_table")
-                if hasattr(self, "current_plot"):
-                    delattr(self, "current_plot")
+                # Only one panel is packed at a time, so detach just that one instead of
+                # walking every child; an uncached panel is destroyed once the new one is drawn
+                panel, self._current_panel = self._current_panel, None
+                if panel is not None:
+                    panel.pack_forget()
+                    if panel not in self._screens.values():
+                        self.root.after_idle(lambda: self._safe_destroy(panel))
                 
-        except Exception as e:
-            self.logger.error(f"Error clearing content: {str(e)}")
+        except Exception:
+            logger.exception("Error clearing content")
             # Continue execution even if there's an error
 
+    def _reset_content(self):
+        """Detach every child of the content frame and destroy the uncached ones.
+        
+        Used after a failed screen build, which may have left a partial,
+        untracked widget tree behind.
+        """
+        self.clear_content()
+        if not getattr(self, "content_frame_alive", False):
+            return
+        
+        cached = set(self._screens.values())
+        stale = []
+        for widget in self.content_frame.winfo_children():
+            widget.pack_forget()
+            if widget not in cached:
+                stale.append(widget)
+        
+        if stale:
+            self.root.after_idle(lambda: [self._safe_destroy(widget) for widget in stale])
+
+    def _show_screen(self, name, build, padding=10):
+        """Replace the current content with the cached screen name, calling build on first use."""
+        self.clear_content()
+        
+        screen = self._screens.get(name)
+        if screen is None or not screen.winfo_exists():
+            build()
+            screen = self._screens[name]
+        
+        screen.pack(fill="both", expand=True, padx=padding, pady=padding)
+        self._current_panel = screen
+        self._current_screen = name
+
+    def _register(self, name, widget):
+        """Store widget as self.<name> and track in self.<name>_alive whether Tk still has it.
+        
+        The flag is cleared by a <Destroy> binding, so liveness checks need no winfo_exists round-trip.
+        """
+        setattr(self, name, widget)
+        setattr(self, name + "_alive", True)
+        
+        def on_destroy(event):
+            # <Destroy> is also delivered for each destroyed descendant
+            if event.widget is widget:
+                setattr(self, name + "_alive", False)
+        
+        widget.bind("<Destroy>", on_destroy, add="+")
+        return widget
+
+    @staticmethod
+    def _safe_destroy(widget):
+        """Destroy a widget unless Tk has already destroyed it."""
+        try:
+            if widget.winfo_exists():
+                widget.destroy()
+        except tk.TclError:
+            pass
+
+    @_screen("history", "Error loading history screen")
     def show_history(self):
-        """Display the history screen."""
+        """Display the history screen, reusing the cached view when possible."""
+        # Build the widget tree only once; later visits just re-attach it
+        self._show_screen("history", self._build_history_view)
+        self._refresh_history_view()
+
+    def _build_history_view(self):
+        """Build the history widget tree once; it is detached, not destroyed, on navigation."""
+        # Theme colors used throughout this builder
+        bg_color = self._c_bg
+        text_color = self._c_text
+        
+        # Create a frame for the history table that takes up most of the space
+        history_frame = ctk.CTkFrame(self.content_frame, fg_color=bg_color)
+        self._history_data_version = None
+        self._history_solution_shown = None
+        self._last_solution_frame = None
+        
+        # Create a label for the history
+        history_label = ctk.CTkLabel(
+            history_frame,
+            text="Calculation History",
+            font=self._fonts["title"],
+            text_color=text_color
+        )
+        history_label.pack(pady=(0, 10))
+        
+        # Create a container frame for the table with fixed height
+        table_container = ctk.CTkFrame(history_frame, fg_color=bg_color, height=400)
+        table_container.pack(fill="both", expand=True, padx=5, pady=5)
+        table_container.pack_propagate(False)  # Prevent the frame from resizing based on its children
+        
+        # Create the history table with fixed height
+        self.history_table = ResultTable(table_container, self.theme, theme_manager=self.theme_manager, height=400, fixed_position=True)
+        self.history_table.table_frame.pack(fill="both", expand=True)
+        
+        # Create button container
+        button_container = ctk.CTkFrame(history_frame, fg_color=bg_color)
+        button_container.pack(fill="x", pady=10)
+        # Two equal columns center each button in its half without repeated pack expansion
+        button_container.grid_columnconfigure((0, 1), weight=1)
+        self._history_buttons = button_container
+        
+        self._theme_frames.extend([history_frame, table_container, button_container])
+        self._theme_labels.append(history_label)
+        self._screens["history"] = history_frame
+        
+        # Add a back button at the bottom
+        back_button = self._primary_button(button_container, "Back to Home", lambda: self._navigate(self.show_home))
+        back_button.grid(row=0, column=1, padx=10)
+        
+        # Single status label reused for every clear message; empty text keeps it blank
+        status_label = ctk.CTkLabel(history_frame, text="", font=self._fonts["body"])
+        status_label.pack(pady=10)
+        self._history_status_label = status_label
+        
+        def show_status(text, color, duration):
+            status_label.configure(text=text, text_color=color)
+            self._schedule_toast_hide(duration, lambda: status_label.configure(text=""))
+        
+        # Add a clear history button
+        def clear_history():
+            try:
+                if self.history_manager.clear_history():
+                    # Reload the history data
+                    self._refresh_history_view()
+                    
+                    # Show success message for 3 seconds
+                    show_status("History cleared successfully!", "green", 3000)
+                else:
+                    raise Exception("Failed to clear history")
+            except Exception as e:
+                logger.exception("Error clearing history")
+                # Show error message for 5 seconds
+                show_status(f"Error clearing history: {str(e)}", "red", 5000)
+        
+        clear_button = self._secondary_button(button_container, "Clear History", clear_history)
+        clear_button.grid(row=0, column=0, padx=10)
+
+    def _refresh_history_view(self):
+        """Update the cached history view only where its data has changed."""
+        # Reload the table only when the history file was written since the last render
         try:
-            self.clear_content()
-            
-            # Create a frame for the history table that takes up most of the space
-            history_frame = ctk.CTkFrame(self.content_frame, fg_color=self.theme.get("bg", "#F0F4F8"))
-            history_frame.pack(fill="both", expand=True, padx=10, pady=10)
-            
-            # Create a label for the history
-            history_label = ctk.CTkLabel(
-                history_frame,
-                text="Calculation History",
-                font=ctk.CTkFont(size=24, weight="bold"),
-                text_color=self.theme.get("text", "#1E293B")
-            )
-            history_label.pack(pady=(0, 10))
+            version = self.history_manager.version()
+            if version != self._history_data_version:
+                history_data = self.history_manager.load_history()
+                self.history_table.display_history(history_data)
+                self._history_data_version = version
+        except Exception as history_error:
+            logger.exception("Error loading history data")
+            self.history_table.display({"Error": f"Error loading history: {str(history_error)}"})
+            self._history_data_version = None
+        
+        # Rebuild the last solution panel only when a new solution was computed
+        last_solution = getattr(self, "last_solution", None)
+        if last_solution is self._history_solution_shown:
+            return
+        if self._last_solution_frame is not None and self._last_solution_frame.winfo_exists():
+            self._last_solution_frame.destroy()
+        self._last_solution_frame = None
+        # The cached full solution window shows the previous solution
+        if self._full_solution_window is not None:
+            self._safe_destroy(self._full_solution_window)
+            self._full_solution_window = None
+        self._history_solution_shown = last_solution
+        
+        if last_solution:
+            try:
+                self._build_last_solution_panel()
+            except Exception:
+                logger.exception("Error displaying last solution")
+
+    def _build_last_solution_panel(self):
+        """Create the last solution summary between the history table and the buttons."""
+        # Theme colors used throughout this builder
+        bg_color = self._c_bg
+        fg_color = self._c_fg
+        text_color = self._c_text
+        accent_color = self._c_accent
+        primary_color = self._c_primary
+        primary_hover_color = self._c_primary_hover
+        primary_light_color = self.theme.get("primary_light", "#EFF6FF")
+        border_color = self.theme.get("border", "#CBD5E1")
+        secondary_color = self._c_secondary
+        secondary_hover_color = self._c_secondary_hover
+        
+        func, method, root, table_data = self.last_solution
+        
+        # Create a frame for the last solution
+        last_solution_frame = ctk.CTkFrame(self._screens["history"], fg_color=bg_color)
+        last_solution_frame.pack(fill="x", padx=5, pady=10, before=self._history_buttons)
+        self._last_solution_frame = last_solution_frame
+        
+        # Add a label for the last solution
+        last_solution_label = ctk.CTkLabel(
+            last_solution_frame,
+            text="Last Solution",
+            font=self._fonts["section"],
+            text_color=text_color
+        )
+        last_solution_label.pack(pady=(0, 5))
+        
+        # Create a frame for the solution details
+        details_frame = ctk.CTkFrame(last_solution_frame, fg_color=bg_color)
+        details_frame.pack(fill="x", padx=10, pady=5)
+        
+        # Display function and method
+        ctk.CTkLabel(
+            details_frame,
+            text=f"Function: {func}",
+            font=self._fonts["body"],
+            text_color=text_color
+        ).pack(anchor="w", pady=2)
+        
+        ctk.CTkLabel(
+            details_frame,
+            text=f"Method: {method}",
+            font=self._fonts["body"],
+            text_color=text_color
+        ).pack(anchor="w", pady=2)
+        
+        # Display root if available
+        if root is not None:
+            ctk.CTkLabel(
+                details_frame,
+                text=f"Root: {root}",
+                font=self._fonts["btn"],
+                text_color=accent_color
+            ).pack(anchor="w", pady=2)
+        
+        # Add a button to view the full solution
+        def view_full_solution():
+            # Re-show the window built for this solution on an earlier press
+            solution_window = self._full_solution_window
+            if solution_window is not None and solution_window.winfo_exists():
+                solution_window.deiconify()
+                solution_window.lift()
+                solution_window.grab_set()
+                return
             
-            # Create a container frame for the table with fixed height
-            table_container = ctk.CTkFrame(history_frame, fg_color=self.theme.get("bg", "#F0F4F8"), height=400)
-            table_container.pack(fill="both", expand=True, padx=5, pady=5)
-            table_container.pack_propagate(False)  # Prevent the frame from resizing based on its children
+            # Create a new window for the full solution
+            solution_window = ctk.CTkToplevel(self.root)
+            solution_window.title("Solution Details")
+            solution_window.geometry("900x650")
+            solution_window.grab_set()  # Make the window modal
+            self._full_solution_window = solution_window
             
-            # Create the history table with fixed height
-            self.history_table = ResultTable(table_container, self.theme, height=400, fixed_position=True)
-            self.history_table.table_frame.pack(fill="both", expand=True)
+            # Closing only hides the window so the next press does not rebuild the table
+            def hide_window():
+                solution_window.grab_release()
+                solution_window.withdraw()
             
-            # Load and display history data
-            try:
-                history_data = self.history_manager.load_history()
-                self.history_table.display_history(history_data)
-                
-                # Display last solution if available
-                if hasattr(self, "last_solution") and self.last_solution:
-                    try:
-                        func, method, root, table_data = self.last_solution
-                        
-                        # Create a frame for the last solution
-                        last_solution_frame = ctk.CTkFrame(history_frame, fg_color=self.theme.get("bg", "#F0F4F8"))
-                        last_solution_frame.pack(fill="x", padx=5, pady=10)
-                        
-                        # Add a label for the last solution
-                        last_solution_label = ctk.CTkLabel(
-                            last_solution_frame,
-                            text="Last Solution",
-                            font=ctk.CTkFont(size=18, weight="bold"),
-                            text_color=self.theme.get("text", "#1E293B")
-                        )
-                        last_solution_label.pack(pady=(0, 5))
-                        
-                        # Create a frame for the solution details
-                        details_frame = ctk.CTkFrame(last_solution_frame, fg_color=self.theme.get("bg", "#F0F4F8"))
-                        details_frame.pack(fill="x", padx=10, pady=5)
-                        
-                        # Display function and method
-                        ctk.CTkLabel(
-                            details_frame,
-                            text=f"Function: {func}",
-                            font=ctk.CTkFont(size=14),
-                            text_color=self.theme.get("text", "#1E293B")
-                        ).pack(anchor="w", pady=2)
-                        
-                        ctk.CTkLabel(
-                            details_frame,
-                            text=f"Method: {method}",
-                            font=ctk.CTkFont(size=14),
-                            text_color=self.theme.get("text", "#1E293B")
-                        ).pack(anchor="w", pady=2)
-                        
-                        # Display root if available
-                        if root is not None:
-                            ctk.CTkLabel(
-                                details_frame,
-                                text=f"Root: {root}",
-                                font=ctk.CTkFont(size=14, weight="bold"),
-                                text_color=self.theme.get("accent", "#0EA5E9")
-                            ).pack(anchor="w", pady=2)
-                        
-                        # Add a button to view the full solution
-                        def view_full_solution():
-                            # Create a new window for the full solution
-                            solution_window = ctk.CTkToplevel(self.root)
-                            solution_window.title("Solution Details")
-                            solution_window.geometry("900x650")
-                            solution_window.grab_set()  # Make the window modal
-                            
-                            # Create a frame for the solution
-                            solution_frame = ctk.CTkFrame(solution_window, fg_color=self.theme.get("bg", "#F0F4F8"))
-                            solution_frame.pack(fill="both", expand=True, padx=8, pady=8)  # Reduced padding
-                            
-                            # Create header with method and function
-                            header_frame = ctk.CTkFrame(solution_frame, fg_color=self.theme.get("fg", "#E2E8F0"))
-                            header_frame.pack(fill="x", padx=2, pady=(0, 5))  # Reduced padding
-                            
-                            # Method title on left
-                            method_label = ctk.CTkLabel(
-                                header_frame,
-                                text=f"Method: {method}",
-                                font=ctk.CTkFont(size=14, weight="bold"),  # Reduced font size
-                                text_color=self.theme.get("text", "#1E293B")
-                            )
-                            method_label.pack(side="left", padx=8, pady=5)  # Reduced padding
-                            
-                            # Function on right
-                            func_label = ctk.CTkLabel(
-                                header_frame,
-                                text=f"Function: {func}",
-                                font=ctk.CTkFont(size=14),  # Reduced font size
-                                text_color=self.theme.get("text", "#1E293B")
-                            )
-                            func_label.pack(side="right", padx=8, pady=5)  # Reduced padding
-                            
-                            # Create a container for the solution table with fixed height and better styling
-                            solution_table_container = ctk.CTkFrame(solution_frame, 
-                                                                  fg_color=self.theme.get("bg", "#F0F4F8"), 
-                                                                  height=470,
-                                                                  border_width=1,
-                                                                  border_color=self.theme.get("border", "#CBD5E1"))
-                            solution_table_container.pack(fill="both", expand=True, padx=2, pady=2)  # Reduced padding
-                            solution_table_container.pack_propagate(False)  # Prevent container from resizing
-                            
-                            # Create the table with fixed position
-                            solution_table = ResultTable(solution_table_container, self.theme, height=470, fixed_position=True)
-                            solution_table.table_frame.pack(fill="both", expand=True)
-                            solution_table.display(table_data)
-                            
-                            # Create a result frame at the bottom with reduced padding
-                            result_frame = ctk.CTkFrame(solution_frame, 
-                                                      fg_color=self.theme.get("primary_light", "#EFF6FF"),
-                                                      corner_radius=4)  # Reduced corner radius
-                            result_frame.pack(fill="x", padx=2, pady=(2, 5))  # Reduced padding
-                            
-                            # Add the root result in the result frame
-                            if root is not None:
-                                root_label = ctk.CTkLabel(
-                                    result_frame,
-                                    text=f"Root found: {root}",
-                                    font=ctk.CTkFont(size=14, weight="bold"),  # Reduced font size
-                                    text_color=self.theme.get("primary", "#3B82F6")
-                                )
-                                root_label.pack(pady=5)  # Reduced padding
-                            
-                            # Add a divider with reduced padding
-                            divider = ctk.CTkFrame(solution_frame, height=1, fg_color=self.theme.get("border", "#CBD5E1"))
-                            divider.pack(fill="x", padx=2, pady=(0, 5))  # Reduced padding
-                            
-                            # Add button frame at the bottom with reduced padding
-                            button_frame = ctk.CTkFrame(solution_frame, fg_color=self.theme.get("bg", "#F0F4F8"))
-                            button_frame.pack(fill="x", padx=2, pady=(0, 2))  # Reduced padding
-                            
-                            # Add export button with smaller size
-                            export_button = ctk.CTkButton(
-                                button_frame,
-                                text="Export PDF",
-                                command=lambda: self.export_solution(),
-                                fg_color=self.theme.get("secondary", "#64748B"),
-                                hover_color=self.theme.get("secondary_hover", "#475569"),
-                                text_color="white",
-                                font=ctk.CTkFont(size=12, weight="bold"),  # Reduced font size
-                                width=100  # Reduced width
-                            )
-                            export_button.pack(side="left", padx=5)  # Reduced padding
-                            
-                            # Add a close button with smaller size
-                            close_button = ctk.CTkButton(
-                                button_frame,
-                                text="Close",
-                                command=solution_window.destroy,
-                                fg_color=self.theme.get("primary", "#3B82F6"),
-                                hover_color=self.theme.get("primary_hover", "#2563EB"),
-                                text_color="white",
-                                font=ctk.CTkFont(size=12, weight="bold"),  # Reduced font size
-                                width=100  # Reduced width
-                            )
-                            close_button.pack(side="right", padx=5)  # Reduced padding
-                        
-                        view_button = ctk.CTkButton(
-                            details_frame,
-                            text="View Full Solution",
-                            command=view_full_solution,
-                            fg_color=self.theme.get("primary", "#3B82F6"),
-                            hover_color=self.theme.get("primary_hover", "#2563EB"),
-                            text_color="white",
-                            font=ctk.CTkFont(size=14, weight="bold")
-                        )
-                        view_button.pack(pady=10)
-                        
-                    except Exception as solution_error:
-                        self.logger.error(f"Error displaying last solution: {str(solution_error)}")
-            except Exception as history_error:
-                self.logger.error(f"Error loading history data: {str(history_error)}")
-                self.history_table.display({"Error": f"Error loading history: {str(history_error)}"})
-            
-            # Create button container
-            button_container = ctk.CTkFrame(history_frame, fg_color=self.theme.get("bg", "#F0F4F8"))
-            button_container.pack(fill="x", pady=10)
-            
-            # Add a back button at the bottom
-            back_button = ctk.CTkButton(
-                button_container,
-                text="Back to Home",
-                command=self.show_home,
-                fg_color=self.theme.get("primary", "#3B82F6"),
-                hover_color=self.theme.get("primary_hover", "#2563EB"),
-                text_color="white",
-                font=ctk.CTkFont(size=14, weight="bold")
-            )
-            back_button.pack(side="right", padx=10, expand=True)
-            
-            # Add a clear history button
-            def clear_history():
-                try:
-                    if self.history_manager.clear_history():
-                        # Reload the history data
-                        history_data = self.history_manager.load_history()
-                        self.history_table.display_history(history_data)
-                        
-                        # Show success message
-                        success_label = ctk.CTkLabel(
-                            history_frame, 
-                            text="History cleared successfully!", 
-                            text_color="green", 
-                            font=ctk.CTkFont(size=14)
-                        )
-                        success_label.pack(pady=10)
-                        
-                        # Remove the success message after 3 seconds and track the after ID
-                        if "clear_history_success" in self.after_ids:
-                            self.root.after_cancel(self.after_ids["clear_history_success"])
-                        self.safe_after(3000, success_label.destroy, "clear_history_success")
-                    else:
-                        raise Exception("Failed to clear history")
-                except Exception as e:
-                    self.logger.error(f"Error clearing history: {str(e)}")
-                    error_label = ctk.CTkLabel(
-                        history_frame, 
-                        text=f"Error clearing history: {str(e)}", 
-                        text_color="red", 
-                        font=ctk.CTkFont(size=14)
-                    )
-                    error_label.pack(pady=10)
-                    
-                    # Remove the error message after 5 seconds and track the after ID
-                    if "clear_history_error" in self.after_ids:
-                        self.root.after_cancel(self.after_ids["clear_history_error"])
-                    self.safe_after(5000, error_label.destroy, "clear_history_error")
-            
-            clear_button = ctk.CTkButton(
-                button_container,
-                text="Clear History",
-                command=clear_history,
-                fg_color=self.theme.get("secondary", "#64748B"),
-                hover_color=self.theme.get("secondary_hover", "#475569"),
-                text_color="white",
-                font=ctk.CTkFont(size=14, weight="bold")
-            )
-            clear_button.pack(side="left", padx=10, expand=True)
-            
-        except Exception as e:
-            self.logger.error(f"Error showing history screen: {str(e)}")
-            # Create a basic error display if the history frame creation fails
-            error_frame = ctk.CTkFrame(self.content_frame, fg_color=self.theme.get("bg", "#F0F4F8"))
-            error_frame.pack(fill="both", expand=True, padx=10, pady=10)
-            
-            error_label = ctk.CTkLabel(
-                error_frame,
-                text=f"Error loading history screen: {str(e)}",
-                text_color="red",
-                font=ctk.CTkFont(size=14)
-            )
-            error_label.pack(pady=10)
-            
-            # Add a back button to return to home
-            back_button = ctk.CTkButton(
-                error_frame,
-                text="Back to Home",
-                command=self.show_home,
-                fg_color=self.theme.get("primary", "#3B82F6"),
-                hover_color=self.theme.get("primary_hover", "#2563EB"),
-                text_color="white",
-                font=ctk.CTkFont(size=14, weight="bold")
-            )
-            back_button.pack(pady=10)
-
-    def show_settings(self):
-        """Display the settings screen with error handling."""
-        try:
-            self.clear_content()
-            
-            # Create a frame for the settings
-            settings_frame = ctk.CTkFrame(self.content_frame, fg_color=self.theme.get("bg", "#F0F4F8"))
-            settings_frame.pack(fill="both", expand=True, padx=20, pady=20)
-            
-            # Add a title with icon
-            title_frame = ctk.CTkFrame(settings_frame, fg_color=self.theme.get("bg", "#F0F4F8"))
-            title_frame.pack(fill="x", pady=(20, 10))
-            
-            title_label = ctk.CTkLabel(
-                title_frame, 
-                text="Settings & Preferences",
-                font=ctk.CTkFont(size=28, weight="bold"),
-                text_color=self.theme.get("text", "#1E293B")
-            )
-            title_label.pack(side="left", padx=20)
-            
-            subtitle = ctk.CTkLabel(
-                settings_frame, 
-                text="Customize the application to suit your workflow",
-                font=ctk.CTkFont(size=14),
-                text_color=self.theme.get("text", "#64748B")
-            )
-            subtitle.pack(pady=(0, 20), anchor="w", padx=20)
-            
-            # Create a scrollable frame for settings
-            scrollable_frame = ctk.CTkScrollableFrame(
-                settings_frame, 
-                fg_color=self.theme.get("bg", "#F0F4F8"),
-                width=700,
-                height=450
-            )
-            scrollable_frame.pack(fill="both", expand=True, padx=10, pady=10)
-            
-            # --- Calculation Settings Card ---
-            calc_card = ctk.CTkFrame(scrollable_frame, fg_color=self.theme.get("fg", "#DDE4E6"), corner_radius=10)
-            calc_card.pack(fill="x", pady=10, padx=5, ipady=10)
-            
-            calc_header = ctk.CTkLabel(
-                calc_card, 
-                text="Calculation Settings",
-                font=ctk.CTkFont(size=18, weight="bold"),
-                text_color=self.theme.get("accent", "#4C51BF")
-            )
-            calc_header.pack(anchor="w", padx=15, pady=(10, 15))
-            
-            # Default Decimal Places
-            decimal_frame = ctk.CTkFrame(calc_card, fg_color="transparent")
-            decimal_frame.pack(fill="x", pady=5, padx=15)
-            
-            decimal_label = ctk.CTkLabel(
-                decimal_frame, 
-                text="Default Decimal Places:", 
-                font=ctk.CTkFont(size=14),
-                text_color=self.theme.get("text", "#1E293B"),
-                width=200,
-                anchor="w"
-            )
-            decimal_label.pack(side="left")
-            
-            decimal_var = ctk.StringVar(value=str(self.solver.decimal_places))
-            decimal_entry = ctk.CTkEntry(
-                decimal_frame, 
-                width=120, 
-                textvariable=decimal_var,
-                placeholder_text="e.g., 6"
-            )
-            decimal_entry.pack(side="left", padx=10)
-            
-            decimal_info = ctk.CTkLabel(
-                decimal_frame,
-                text="Affects display precision",
-                font=ctk.CTkFont(size=12),
-                text_color=self.theme.get("text", "#64748B")
-            )
-            decimal_info.pack(side="left", padx=10)
-            
-            # Maximum Iterations
-            iter_frame = ctk.CTkFrame(calc_card, fg_color="transparent")
-            iter_frame.pack(fill="x", pady=5, padx=15)
-            
-            iter_label = ctk.CTkLabel(
-                iter_frame, 
-                text="Maximum Iterations:", 
-                font=ctk.CTkFont(size=14),
-                text_color=self.theme.get("text", "#1E293B"),
-                width=200,
-                anchor="w"
-            )
-            iter_label.pack(side="left")
-            
-            iter_var = ctk.StringVar(value=str(self.solver.max_iter))
-            iter_entry = ctk.CTkEntry(
-                iter_frame, 
-                width=120, 
-                textvariable=iter_var,
-                placeholder_text="e.g., 50"
-            )
-            iter_entry.pack(side="left", padx=10)
-            
-            iter_info = ctk.CTkLabel(
-                iter_frame,
-                text="Higher values may increase accuracy",
-                font=ctk.CTkFont(size=12),
-                text_color=self.theme.get("text", "#64748B")
-            )
-            iter_info.pack(side="left", padx=10)
-            
-            # Error Tolerance
-            eps_frame = ctk.CTkFrame(calc_card, fg_color="transparent")
-            eps_frame.pack(fill="x", pady=5, padx=15)
-            
-            eps_label = ctk.CTkLabel(
-                eps_frame, 
-                text="Error Tolerance:", 
-                font=ctk.CTkFont(size=14),
-                text_color=self.theme.get("text", "#1E293B"),
-                width=200,
-                anchor="w"
-            )
-            eps_label.pack(side="left")
-            
-            eps_var = ctk.StringVar(value=str(self.solver.eps))
-            eps_entry = ctk.CTkEntry(
-                eps_frame, 
-                width=120, 
-                textvariable=eps_var,
-                placeholder_text="e.g., 0.0001"
-            )
-            eps_entry.pack(side="left", padx=10)
-            
-            eps_info = ctk.CTkLabel(
-                eps_frame,
-                text="Lower values increase precision",
-                font=ctk.CTkFont(size=12),
-                text_color=self.theme.get("text", "#64748B")
-            )
-            eps_info.pack(side="left", padx=10)
-            
-            # Maximum Epsilon Value
-            max_eps_frame = ctk.CTkFrame(calc_card, fg_color="transparent")
-            max_eps_frame.pack(fill="x", pady=5, padx=15)
-            
-            max_eps_label = ctk.CTkLabel(
-                max_eps_frame, 
-                text="Maximum Epsilon Value:", 
-                font=ctk.CTkFont(size=14),
-                text_color=self.theme.get("text", "#1E293B"),
-                width=200,
-                anchor="w"
-            )
-            max_eps_label.pack(side="left")
-            
-            max_eps_var = ctk.StringVar(value=str(getattr(self.solver, "max_eps", 1.0)))
-            max_eps_entry = ctk.CTkEntry(
-                max_eps_frame, 
-                width=120, 
-                textvariable=max_eps_var,
-                placeholder_text="e.g., 1.0"
-            )
-            max_eps_entry.pack(side="left", padx=10)
-            
-            max_eps_info = ctk.CTkLabel(
-                max_eps_frame,
-                text="Upper bound for convergence check",
-                font=ctk.CTkFont(size=12),
-                text_color=self.theme.get("text", "#64748B")
-            )
-            max_eps_info.pack(side="left", padx=10)
-            
-            # Stop Condition
-            stop_frame = ctk.CTkFrame(calc_card, fg_color="transparent")
-            stop_frame.pack(fill="x", pady=5, padx=15)
-            
-            stop_label = ctk.CTkLabel(
-                stop_frame, 
-                text="Stop Condition:", 
-                font=ctk.CTkFont(size=14),
-                text_color=self.theme.get("text", "#1E293B"),
-                width=200,
-                anchor="w"
-            )
-            stop_label.pack(side="left")
-            
-            stop_var = ctk.StringVar(value="Error Tolerance" if self.solver.stop_by_eps else "Maximum Iterations")
-            stop_option = ctk.CTkOptionMenu(
-                stop_frame, 
-                values=["Error Tolerance", "Maximum Iterations", "Both"], 
-                variable=stop_var, 
-                width=120,
-                dropdown_fg_color=self.theme.get("bg", "#F0F4F8"),
-                fg_color=self.theme.get("button", "#4C51BF"), 
-                button_color=self.theme.get("button_hover", "#3C41AF"),
-                button_hover_color=self.theme.get("accent", "#4C51BF")
-            )
-            stop_option.pack(side="left", padx=10)
-            
-            stop_info = ctk.CTkLabel(
-                stop_frame,
-                text="Determines when to stop iterations",
-                font=ctk.CTkFont(size=12),
-                text_color=self.theme.get("text", "#64748B")
-            )
-            stop_info.pack(side="left", padx=10)
-
-            # --- User Interface Settings Card ---
-            ui_card = ctk.CTkFrame(scrollable_frame, fg_color=self.theme.get("fg", "#DDE4E6"), corner_radius=10)
-            ui_card.pack(fill="x", pady=10, padx=5, ipady=10)
-            
-            ui_header = ctk.CTkLabel(
-                ui_card, 
-                text="User Interface Settings",
-                font=ctk.CTkFont(size=18, weight="bold"),
-                text_color=self.theme.get("accent", "#4C51BF")
-            )
-            ui_header.pack(anchor="w", padx=15, pady=(10, 15))
-            
-            # Theme Selection
-            theme_frame = ctk.CTkFrame(ui_card, fg_color="transparent")
-            theme_frame.pack(fill="x", pady=5, padx=15)
-            
-            theme_label = ctk.CTkLabel(
-                theme_frame, 
-                text="Application Theme:", 
-                font=ctk.CTkFont(size=14),
-                text_color=self.theme.get("text", "#1E293B"),
-                width=200,
-                anchor="w"
-            )
-            theme_label.pack(side="left")
-            
-            # Currently only light theme is available
-            theme_var = ctk.StringVar(value="Light")
-            theme_option = ctk.CTkOptionMenu(
-                theme_frame, 
-                values=["Light"], 
-                variable=theme_var,
-                width=120,
-                dropdown_fg_color=self.theme.get("bg", "#F0F4F8"),
-                fg_color=self.theme.get("button", "#4C51BF"), 
-                button_color=self.theme.get("button_hover", "#3C41AF"),
-                button_hover_color=self.theme.get("accent", "#4C51BF")
-            )
-            theme_option.pack(side="left", padx=10)
-            
-            theme_info = ctk.CTkLabel(
-                theme_frame,
-                text="More themes coming soon",
-                font=ctk.CTkFont(size=12),
-                text_color=self.theme.get("text", "#64748B")
-            )
-            theme_info.pack(side="left", padx=10)
-            
-            # Font Size
-            font_frame = ctk.CTkFrame(ui_card, fg_color="transparent")
-            font_frame.pack(fill="x", pady=5, padx=15)
-            
-            font_label = ctk.CTkLabel(
-                font_frame, 
-                text="Font Size:", 
-                font=ctk.CTkFont(size=14),
-                text_color=self.theme.get("text", "#1E293B"),
-                width=200,
-                anchor="w"
-            )
-            font_label.pack(side="left")
-            
-            font_size = getattr(self, "font_size", "Medium")
-            font_var = ctk.StringVar(value=font_size)
-            font_option = ctk.CTkOptionMenu(
-                font_frame, 
-                values=["Small", "Medium", "Large"], 
-                variable=font_var,
-                width=120,
-                dropdown_fg_color=self.theme.get("bg", "#F0F4F8"),
-                fg_color=self.theme.get("button", "#4C51BF"), 
-                button_color=self.theme.get("button_hover", "#3C41AF"),
-                button_hover_color=self.theme.get("accent", "#4C51BF")
-            )
-            font_option.pack(side="left", padx=10)
+            solution_window.protocol("WM_DELETE_WINDOW", hide_window)
             
-            font_info = ctk.CTkLabel(
-                font_frame,
-                text="Affects UI text size",
-                font=ctk.CTkFont(size=12),
-                text_color=self.theme.get("text", "#64748B")
-            )
-            font_info.pack(side="left", padx=10)
-            
-            # Auto-save Settings
-            autosave_frame = ctk.CTkFrame(ui_card, fg_color="transparent")
-            autosave_frame.pack(fill="x", pady=5, padx=15)
-            
-            autosave_label = ctk.CTkLabel(
-                autosave_frame, 
-                text="Auto-save Results:", 
-                font=ctk.CTkFont(size=14),
-                text_color=self.theme.get("text", "#1E293B"),
-                width=200,
-                anchor="w"
-            )
-            autosave_label.pack(side="left")
-            
-            autosave = getattr(self, "autosave", False)
-            autosave_var = ctk.BooleanVar(value=autosave)
-            autosave_switch = ctk.CTkSwitch(
-                autosave_frame, 
-                text="", 
-                variable=autosave_var,
-                width=60,
-                fg_color=self.theme.get("bg", "#F0F4F8"),
-                progress_color=self.theme.get("accent", "#4C51BF"),
-                button_color=self.theme.get("fg", "#DDE4E6"),
-                button_hover_color=self.theme.get("fg", "#DDE4E6"),
-            )
-            autosave_switch.pack(side="left", padx=10)
-            
-            autosave_info = ctk.CTkLabel(
-                autosave_frame,
-                text="Automatically save calculation results",
-                font=ctk.CTkFont(size=12),
-                text_color=self.theme.get("text", "#64748B")
-            )
-            autosave_info.pack(side="left", padx=10)
+            # Create a frame for the solution
+            solution_frame = ctk.CTkFrame(solution_window, fg_color=bg_color)
+            solution_frame.pack(fill="both", expand=True, padx=8, pady=8)  # Reduced padding
             
-            # --- Advanced Settings Card ---
-            adv_card = ctk.CTkFrame(scrollable_frame, fg_color=self.theme.get("fg", "#DDE4E6"), corner_radius=10)
-            adv_card.pack(fill="x", pady=10, padx=5, ipady=10)
+            # Create header with method and function
+            header_frame = ctk.CTkFrame(solution_frame, fg_color=fg_color)
+            header_frame.pack(fill="x", padx=2, pady=(0, 5))  # Reduced padding
             
-            adv_header = ctk.CTkLabel(
-                adv_card, 
-                text="Advanced Settings",
-                font=ctk.CTkFont(size=18, weight="bold"),
-                text_color=self.theme.get("accent", "#4C51BF")
-            )
-            adv_header.pack(anchor="w", padx=15, pady=(10, 15))
-            
-            # Export Format
-            export_frame = ctk.CTkFrame(adv_card, fg_color="transparent")
-            export_frame.pack(fill="x", pady=5, padx=15)
-            
-            export_label = ctk.CTkLabel(
-                export_frame, 
-                text="Default Export Format:", 
-                font=ctk.CTkFont(size=14),
-                text_color=self.theme.get("text", "#1E293B"),
-                width=200,
-                anchor="w"
-            )
-            export_label.pack(side="left")
-            
-            export_format = getattr(self, "export_format", "CSV")
-            export_var = ctk.StringVar(value=export_format)
-            export_option = ctk.CTkOptionMenu(
-                export_frame, 
-                values=["CSV", "Excel", "PDF", "JSON"], 
-                variable=export_var,
-                width=120,
-                dropdown_fg_color=self.theme.get("bg", "#F0F4F8"),
-                fg_color=self.theme.get("button", "#4C51BF"), 
-                button_color=self.theme.get("button_hover", "#3C41AF"),
-                button_hover_color=self.theme.get("accent", "#4C51BF")
-            )
-            export_option.pack(side="left", padx=10)
-            
-            export_info = ctk.CTkLabel(
-                export_frame,
-                text="For exporting calculation results",
-                font=ctk.CTkFont(size=12),
-                text_color=self.theme.get("text", "#64748B")
-            )
-            export_info.pack(side="left", padx=10)
-            
-            # Calculation Timeout
-            timeout_frame = ctk.CTkFrame(adv_card, fg_color="transparent")
-            timeout_frame.pack(fill="x", pady=5, padx=15)
-            
-            timeout_label = ctk.CTkLabel(
-                timeout_frame, 
-                text="Calculation Timeout (sec):", 
-                font=ctk.CTkFont(size=14),
-                text_color=self.theme.get("text", "#1E293B"),
-                width=200,
-                anchor="w"
-            )
-            timeout_label.pack(side="left")
-            
-            timeout = getattr(self, "timeout", 30)
-            timeout_var = ctk.StringVar(value=str(timeout))
-            timeout_entry = ctk.CTkEntry(
-                timeout_frame, 
-                width=120, 
-                textvariable=timeout_var,
-                placeholder_text="e.g., 30"
-            )
-            timeout_entry.pack(side="left", padx=10)
+            # Method title on left
+            method_label = ctk.CTkLabel(
+                header_frame,
+                text=f"Method: {method}",
+                font=self._fonts["btn"],  # Reduced font size
+                text_color=text_color
+            )
+            method_label.pack(side="left", padx=8, pady=5)  # Reduced padding
+            
+            # Function on right
+            func_label = ctk.CTkLabel(
+                header_frame,
+                text=f"Function: {func}",
+                font=self._fonts["body"],  # Reduced font size
+                text_color=text_color
+            )
+            func_label.pack(side="right", padx=8, pady=5)  # Reduced padding
+            
+            # Create a container for the solution table with fixed height and better styling
+            solution_table_container = ctk.CTkFrame(solution_frame, 
+                                                  fg_color=bg_color, 
+                                                  height=470,
+                                                  border_width=1,
+                                                  border_color=border_color)
+            solution_table_container.pack(fill="both", expand=True, padx=2, pady=2)  # Reduced padding
+            solution_table_container.pack_propagate(False)  # Prevent container from resizing
+            
+            # Create the table with fixed position
+            solution_table = ResultTable(solution_table_container, self.theme, theme_manager=self.theme_manager, height=470, fixed_position=True)
+            solution_table.table_frame.pack(fill="both", expand=True)
+            solution_table.display(table_data)
+            
+            # Create a result frame at the bottom with reduced padding
+            result_frame = ctk.CTkFrame(solution_frame, 
+                                      fg_color=primary_light_color,
+                                      corner_radius=4)  # Reduced corner radius
+            result_frame.pack(fill="x", padx=2, pady=(2, 5))  # Reduced padding
+            
+            # Add the root result in the result frame
+            if root is not None:
+                root_label = ctk.CTkLabel(
+                    result_frame,
+                    text=f"Root found: {root}",
+                    font=self._fonts["btn"],  # Reduced font size
+                    text_color=primary_color
+                )
+                root_label.pack(pady=5)  # Reduced padding
             
-            timeout_info = ctk.CTkLabel(
-                timeout_frame,
-                text="Maximum time before cancellation",
-                font=ctk.CTkFont(size=12),
-                text_color=self.theme.get("text", "#64748B")
-            )
-            timeout_info.pack(side="left", padx=10)
+            # Add a divider with reduced padding
+            divider = ctk.CTkFrame(solution_frame, height=1, fg_color=border_color)
+            divider.pack(fill="x", padx=2, pady=(0, 5))  # Reduced padding
             
-            # Create button container
-            button_container = ctk.CTkFrame(settings_frame, fg_color=self.theme.get("bg", "#F0F4F8"))
-            button_container.pack(fill="x", pady=20)
+            # Add button frame at the bottom with reduced padding
+            button_frame = ctk.CTkFrame(solution_frame, fg_color=bg_color)
+            button_frame.pack(fill="x", padx=2, pady=(0, 2))  # Reduced padding
             
-            # Save Button
-            def save_settings():
-                try:
-                    # Validate and save decimal places
-                    try:
-                        decimal_places = int(decimal_var.get())
-                        if decimal_places < 0:
-                            raise ValueError("Decimal places must be non-negative")
-                        self.solver.decimal_places = decimal_places
-                    except ValueError as e:
-                        raise ValueError(f"Invalid decimal places: {str(e)}")
-                    
-                    # Validate and save maximum iterations
-                    try:
-                        max_iter = int(iter_var.get())
-                        if max_iter <= 0:
-                            raise ValueError("Maximum iterations must be positive")
-                        self.solver.max_iter = max_iter
-                    except ValueError as e:
-                        raise ValueError(f"Invalid maximum iterations: {str(e)}")
-                    
-                    # Validate and save error tolerance
-                    try:
-                        eps = float(eps_var.get())
-                        if eps <= 0:
-                            raise ValueError("Error tolerance must be positive")
-                        self.solver.eps = eps
-                    except ValueError as e:
-                        raise ValueError(f"Invalid error tolerance: {str(e)}")
-                    
-                    # Validate and save maximum epsilon
-                    try:
-                        max_eps = float(max_eps_var.get())
-                        if max_eps <= 0:
-                            raise ValueError("Maximum epsilon must be positive")
-                        self.solver.max_eps = max_eps
-                    except ValueError as e:
-                        raise ValueError(f"Invalid maximum epsilon: {str(e)}")
-                    
-                    # Save stop condition
-                    self.solver.stop_by_eps = stop_var.get() in ["Error Tolerance", "Both"]
-                    
-                    # Save UI settings
-                    self.font_size = font_var.get()
-                    self.autosave = autosave_var.get()
-                    self.export_format = export_var.get()
-                    
-                    # Save timeout setting
-                    try:
-                        timeout = int(timeout_var.get())
-                        if timeout <= 0:
-                            raise ValueError("Timeout must be positive")
-                        self.timeout = timeout
-                    except ValueError as e:
-                        raise ValueError(f"Invalid timeout: {str(e)}")
-                    
-                    # Show success message with animation
-                    success_frame = ctk.CTkFrame(
-                        settings_frame, 
-                        fg_color=self.theme.get("accent", "#4C51BF"),
-                        corner_radius=10
-                    )
-                    success_frame.place(relx=0.5, rely=0.9, anchor="center", relwidth=0.5, height=40)
-                    
-                    success_label = ctk.CTkLabel(
-                        success_frame, 
-                        text="✓ Settings saved successfully!", 
-                        text_color="white", 
-                        font=ctk.CTkFont(size=14, weight="bold")
-                    )
-                    success_label.pack(pady=10, padx=10, fill="both", expand=True)
-                    
-                    # Remove the success message after 3 seconds and track the after ID
-                    if "save_settings_success" in self.after_ids:
-                        self.root.after_cancel(self.after_ids["save_settings_success"])
-                    
-                    def hide_success():
-                        success_frame.place_forget()
-                        
-                    self.safe_after(3000, hide_success, "save_settings_success")
-                    
-                except Exception as e:
-                    self.logger.error(f"Error saving settings: {str(e)}")
-                    
-                    # Show error message with animation
-                    error_frame = ctk.CTkFrame(
-                        settings_frame, 
-                        fg_color="#E53E3E",  # Error red color
-                        corner_radius=10
-                    )
-                    error_frame.place(relx=0.5, rely=0.9, anchor="center", relwidth=0.7, height=40)
-                    
-                    error_label = ctk.CTkLabel(
-                        error_frame, 
-                        text=f"✗ Error: {str(e)}", 
-                        text_color="white", 
-                        font=ctk.CTkFont(size=14, weight="bold")
-                    )
-                    error_label.pack(pady=10, padx=10, fill="both", expand=True)
-                    
-                    # Remove the error message after 5 seconds and track the after ID
-                    if "save_settings_error" in self.after_ids:
-                        self.root.after_cancel(self.after_ids["save_settings_error"])
-                    
-                    def hide_error():
-                        error_frame.place_forget()
-                        
-                    self.safe_after(5000, hide_error, "save_settings_error")
-            
-            save_button = ctk.CTkButton(
-                button_container, 
-                text="Save Changes",
-                command=save_settings,
-                fg_color=self.theme.get("primary", "#4C51BF"), 
-                hover_color=self.theme.get("primary_hover", "#3C41AF"),
+            # Add export button with smaller size
+            export_button = ctk.CTkButton(
+                button_frame,
+                text="Export PDF",
+                command=lambda: self.export_solution(),
+                fg_color=secondary_color,
+                hover_color=secondary_hover_color,
+                text_color="white",
+                font=self._fonts["caption_bold"],  # Reduced font size
+                width=100  # Reduced width
+            )
+            export_button.pack(side="left", padx=5)  # Reduced padding
+            
+            # Add a close button with smaller size
+            close_button = ctk.CTkButton(
+                button_frame,
+                text="Close",
+                command=hide_window,
+                fg_color=primary_color,
+                hover_color=primary_hover_color,
                 text_color="white",
-                font=ctk.CTkFont(size=14, weight="bold"),
-                height=38,
-                corner_radius=8,
-                width=170
+                font=self._fonts["caption_bold"],  # Reduced font size
+                width=100  # Reduced width
             )
-            save_button.pack(side="left", padx=10, expand=True)
-            
-            # Reset Button
-            def reset_settings():
-                try:
-                    # Reset calculation settings
-                    self.solver.decimal_places = 6
-                    self.solver.max_iter = 50
-                    self.solver.eps = 0.0001
-                    self.solver.max_eps = 1.0
-                    self.solver.stop_by_eps = True
-                    
-                    # Reset UI variables
-                    decimal_var.set("6")
-                    iter_var.set("50")
-                    eps_var.set("0.0001")
-                    max_eps_var.set("1.0")
-                    stop_var.set("Error Tolerance")
+            close_button.pack(side="right", padx=5)  # Reduced padding
+        
+        view_button = self._primary_button(details_frame, "View Full Solution", view_full_solution)
+        view_button.pack(pady=10)
+
+    @_screen("settings", "Error loading settings")
+    def show_settings(self):
+        """Display the settings screen."""
+        # Build the form only once; later visits re-attach it and reload the values
+        self._show_screen("settings", self._build_settings_view, padding=20)
+        self._refresh_settings_view()
+
+    def _settings_values(self):
+        """Return the current settings keyed as in _SETTINGS_FIELDS, as form variable values."""
+        solver = self.solver
+        return {
+            "decimal": str(solver.decimal_places),
+            "iter": str(solver.max_iter),
+            "eps": str(solver.eps),
+            "max_eps": str(solver.max_eps),
+            "stop": "Error Tolerance" if solver.stop_by_eps else "Maximum Iterations",
+            "theme": "Light",
+            "font": getattr(self, "font_size", "Medium"),
+            "autosave": getattr(self, "autosave", False),
+            "export": getattr(self, "export_format", "CSV"),
+            "timeout": str(getattr(self, "timeout", 30)),
+        }
+
+    def _refresh_settings_view(self):
+        """Load the current settings into the cached settings form."""
+        variables = self._settings_vars
+        for key, value in self._settings_values().items():
+            variables[key].set(value)
+
+    def _build_settings_view(self):
+        """Build the settings widget tree once; it is detached, not destroyed, on navigation."""
+        # Bind theme colors and fonts once for the whole build
+        bg = self._c_bg
+        fonts = self._fonts
+        
+        # Create a frame for the settings
+        settings_frame = ctk.CTkFrame(self.content_frame, fg_color=bg)
+        
+        # Collect (widget, pack options) and lay everything out in one pass at the end
+        layout = []
+        
+        # Add a title with icon
+        title_frame = ctk.CTkFrame(settings_frame, fg_color=bg)
+        layout.append((title_frame, dict(fill="x", pady=(20, 10))))
+        
+        title_label = ctk.CTkLabel(
+            title_frame, 
+            text="Settings & Preferences",
+            font=fonts["display"]
+        )
+        layout.append((title_label, dict(side="left", padx=20)))
+        
+        subtitle = ctk.CTkLabel(
+            settings_frame, 
+            text="Customize the application to suit your workflow",
+            font=fonts["body"]
+        )
+        layout.append((subtitle, dict(pady=(0, 20), anchor="w", padx=20)))
+        
+        # Create a scrollable frame for settings
+        scrollable_frame = ctk.CTkScrollableFrame(
+            settings_frame, 
+            fg_color=bg,
+            width=700,
+            height=450
+        )
+        layout.append((scrollable_frame, dict(fill="both", expand=True, padx=10, pady=10)))
+        
+        # Form variables, keyed as in _SETTINGS_FIELDS; show_settings refreshes them on every visit
+        variables = {
+            key: ctk.BooleanVar(value=value) if isinstance(value, bool) else ctk.StringVar(value=value)
+            for key, value in self._settings_values().items()
+        }
+        decimal_var = variables["decimal"]
+        iter_var = variables["iter"]
+        eps_var = variables["eps"]
+        max_eps_var = variables["max_eps"]
+        stop_var = variables["stop"]
+        font_var = variables["font"]
+        autosave_var = variables["autosave"]
+        export_var = variables["export"]
+        timeout_var = variables["timeout"]
+        
+        choices = {"theme": self._theme_names}
+        layout.extend(self._build_form(_SETTINGS_FIELDS, scrollable_frame, variables, choices))
+        
+        # Numeric fields are parsed as they are edited; save_settings applies the
+        # staged (value, error message) pairs instead of parsing on every click
+        staged = {}
+        
+        def stage(spec):
+            try:
+                staged[spec] = (_parse_setting(spec, variables[spec[0]].get()), None)
+            except ValueError as e:
+                staged[spec] = (None, str(e))
+        
+        for spec in _SETTINGS_NUMBERS:
+            self._add_var_trace(variables[spec[0]], lambda variable, spec=spec: stage(spec))
+            stage(spec)
+        
+        # Create button container
+        button_container = ctk.CTkFrame(settings_frame, fg_color=bg)
+        layout.append((button_container, dict(fill="x", pady=20)))
+        # Two equal columns center each button in its half without repeated pack expansion
+        button_container.grid_columnconfigure((0, 1), weight=1)
+        
+        # Single status label reused for every save/reset message; placed on demand
+        self._settings_status_label = ctk.CTkLabel(
+            settings_frame,
+            text="",
+            text_color="white",
+            font=fonts["btn"],
+            corner_radius=10
+        )
+        
+        # Save Button
+        def save_settings():
+            try:
+                # Check every staged numeric field before changing anything, so a
+                # bad value leaves all settings as they were
+                for spec in _SETTINGS_NUMBERS:
+                    error = staged[spec][1]
+                    if error is not None:
+                        raise ValueError(error)
+                
+                for spec in _SETTINGS_NUMBERS:
+                    target, attribute = spec[1], spec[2]
+                    setattr(self.solver if target == "solver" else self, attribute, staged[spec][0])
+                
+                # Save stop condition
+                self.solver.stop_by_eps = stop_var.get() in ["Error Tolerance", "Both"]
+                
+                # Save UI settings
+                self.font_size = font_var.get()
+                self.autosave = autosave_var.get()
+                self.export_format = export_var.get()
+                
+                self._set_settings_status(
+                    "✓ Settings saved successfully!",
+                    self._c_accent,
+                    0.5,
+                    3000
+                )
+                
+            except Exception as e:
+                logger.exception("Error saving settings")
+                
+                self._set_settings_status(
+                    f"✗ Error: {str(e)}",
+                    "#E53E3E",
+                    0.7,
+                    5000
+                )
+        
+        save_button = self._primary_button(
+            button_container,
+            "Save Changes",
+            save_settings,
+            height=38,
+            corner_radius=8,
+            width=170
+        )
+        save_button.grid(row=0, column=0, padx=10)
+        
+        # Reset Button
+        def reset_settings():
+            try:
+                # Reset calculation settings in one step
+                self.solver.apply_defaults()
+                
+                # Reset UI variables without notifying their traces once per write
+                with self._suspend_var_traces(decimal_var, iter_var, eps_var, max_eps_var, stop_var,
+                                              font_var, autosave_var, export_var, timeout_var):
+                    decimal_var.set(str(self.solver.decimal_places))
+                    iter_var.set(str(self.solver.max_iter))
+                    eps_var.set(str(self.solver.eps))
+                    max_eps_var.set(str(self.solver.max_eps))
+                    stop_var.set("Error Tolerance" if self.solver.stop_by_eps else "Maximum Iterations")
                     font_var.set("Medium")
                     autosave_var.set(False)
                     export_var.set("CSV")
                     timeout_var.set("30")
-                    
-                    # Reset UI settings
-                    self.font_size = "Medium"
-                    self.autosave = False
-                    self.export_format = "CSV"
-                    self.timeout = 30
-                    
-                    # Show success message with animation
-                    reset_frame = ctk.CTkFrame(
-                        settings_frame, 
-                        fg_color=self.theme.get("accent", "#4C51BF"),
-                        corner_radius=10
-                    )
-                    reset_frame.place(relx=0.5, rely=0.9, anchor="center", relwidth=0.5, height=40)
-                    
-                    reset_label = ctk.CTkLabel(
-                        reset_frame, 
-                        text="✓ Settings reset to defaults!", 
-                        text_color="white", 
-                        font=ctk.CTkFont(size=14, weight="bold")
-                    )
-                    reset_label.pack(pady=10, padx=10, fill="both", expand=True)
-                    
-                    # Remove the reset message after 3 seconds and track the after ID
-                    if "reset_settings_success" in self.after_ids:
-                        self.root.after_cancel(self.after_ids["reset_settings_success"])
-                    
-                    def hide_reset():
-                        reset_frame.place_forget()
-                        
-                    self.safe_after(3000, hide_reset, "reset_settings_success")
-                    
-                except Exception as e:
-                    self.logger.error(f"Error resetting settings: {str(e)}")
-                    
-                    # Show error message with animation
-                    error_frame = ctk.CTkFrame(
-                        settings_frame, 
-                        fg_color="#E53E3E",  # Error red color
-                        corner_radius=10
-                    )
-                    error_frame.place(relx=0.5, rely=0.9, anchor="center", relwidth=0.7, height=40)
-                    
-                    error_label = ctk.CTkLabel(
-                        error_frame, 
-                        text=f"✗ Error: {str(e)}", 
-                        text_color="white", 
-                        font=ctk.CTkFont(size=14, weight="bold")
-                    )
-                    error_label.pack(pady=10, padx=10, fill="both", expand=True)
-                    
-                    # Remove the error message after 5 seconds and track the after ID
-                    if "reset_settings_error" in self.after_ids:
-                        self.root.after_cancel(self.after_ids["reset_settings_error"])
-                    
-                    def hide_error():
-                        error_frame.place_forget()
-                        
-                    self.safe_after(5000, hide_error, "reset_settings_error")
-            
-            reset_button = ctk.CTkButton(
-                button_container, 
-                text="Reset to Defaults",
-                command=reset_settings,
-                fg_color="transparent", 
-                hover_color=self.theme.get("fg", "#DDE4E6"),
-                text_color=self.theme.get("text", "#1E293B"),
-                font=ctk.CTkFont(size=14),
-                border_width=1,
-                border_color=self.theme.get("text", "#1E293B"),
-                height=38,
-                corner_radius=8,
-                width=170
-            )
-            reset_button.pack(side="right", padx=10, expand=True)
-            
+                # The traces were silenced above, so stage the numeric fields once now
+                for spec in _SETTINGS_NUMBERS:
+                    stage(spec)
+                
+                # Reset UI settings
+                self.font_size = "Medium"
+                self.autosave = False
+                self.export_format = "CSV"
+                self.timeout = 30
+                
+                self._set_settings_status(
+                    "✓ Settings reset to defaults!",
+                    self._c_accent,
+                    0.5,
+                    3000
+                )
+                
+            except Exception as e:
+                logger.exception("Error resetting settings")
+                
+                self._set_settings_status(
+                    f"✗ Error: {str(e)}",
+                    "#E53E3E",
+                    0.7,
+                    5000
+                )
+        
+        reset_button = ctk.CTkButton(
+            button_container, 
+            text="Reset to Defaults",
+            command=reset_settings,
+            fg_color="transparent", 
+            hover_color=self._c_fg,
+            text_color=self._c_text,
+            font=fonts["body"],
+            border_width=1,
+            border_color=self._c_text,
+            height=38,
+            corner_radius=8,
+            width=170
+        )
+        reset_button.grid(row=0, column=1, padx=10)
+        
+        for widget, pack_options in layout:
+            widget.pack(**pack_options)
+        
+        # Only cache the view once it has been built completely
+        self._settings_vars = variables
+        self._screens["settings"] = settings_frame
+
+    def _build_form(self, spec, parent, variables, choices=None):
+        """Create the cards and rows described by spec; return the cards' (widget, pack options) pairs.
+        
+        choices maps a variable key to option values only known at runtime.
+        """
+        choices = choices or {}
+        layout = []
+        card_color = self._c_fg
+        accent = self._c_accent
+        section_font = self._fonts["section"]
+        body_font = self._fonts["body"]
+        caption_font = self._fonts["caption"]
+        
+        # Reject keystrokes that cannot be part of a number before they reach the variable
+        validators = {
+            kind: dict(
+                validate="key",
+                validatecommand=(self.root.register(lambda text, pattern=pattern: pattern.fullmatch(text) is not None), "%P")
+            )
+            for kind, pattern in _ENTRY_PATTERNS.items()
+        }
+        
+        for title, rows in spec:
+            card = ctk.CTkFrame(parent, fg_color=card_color, corner_radius=10)
+            layout.append((card, dict(fill="x", pady=10, padx=5, ipady=10)))
+            
+            # Each card is one grid: the header on top, then label / widget / hint columns.
+            # Gridding straight into the card avoids a CTkFrame per row
+            card.grid_columnconfigure(2, weight=1)
+            header = ctk.CTkLabel(card, text=title, font=section_font, text_color=accent)
+            header.grid(row=0, column=0, columnspan=3, sticky="w", padx=15, pady=(10, 15))
+            
+            for row_index, (key, label_text, kind, options, hint) in enumerate(rows, start=1):
+                widget_class, variable_option, fixed_options = _SETTINGS_WIDGETS[kind]
+                if key in choices:
+                    options = {**options, "values": choices[key]}
+                if kind in validators:
+                    options = {**options, **validators[kind]}
+                
+                label = ctk.CTkLabel(card, text=label_text, font=body_font, width=200, anchor="w")
+                widget = widget_class(card, **{variable_option: variables[key]}, **fixed_options, **options)
+                info = ctk.CTkLabel(card, text=hint, font=caption_font)
+                
+                label.grid(row=row_index, column=0, sticky="w", padx=(15, 0), pady=5)
+                widget.grid(row=row_index, column=1, sticky="w", padx=10, pady=5)
+                info.grid(row=row_index, column=2, sticky="w", padx=10, pady=5)
+        
+        return layout
+
+    def _add_var_trace(self, variable, callback):
+        """Call callback(variable) whenever variable is written, unless its traces are suspended."""
+        def on_write(*args):
+            if str(variable) not in self._suspended_vars:
+                callback(variable)
+        
+        variable.trace_add("write", on_write)
+
+    @contextmanager
+    def _suspend_var_traces(self, *variables):
+        """Silence callbacks added with _add_var_trace while several variables are written."""
+        names = {str(variable) for variable in variables} - self._suspended_vars
+        self._suspended_vars.update(names)
+        try:
+            yield
+        finally:
+            self._suspended_vars.difference_update(names)
+
+    def _primary_button(self, parent, text, command, **kwargs):
+        """Create a button in the primary theme colors, which are the color theme's defaults.
+        
+        The button is registered so update_ui_theme re-colors it on cached screens.
+        """
+        button = ctk.CTkButton(parent, text=text, command=command, font=self._fonts["btn"], **kwargs)
+        self._theme_primary_buttons.append(button)
+        return button
+
+    def _secondary_button(self, parent, text, command, **kwargs):
+        """Create a button in the secondary theme colors."""
+        return ctk.CTkButton(
+            parent,
+            text=text,
+            command=command,
+            fg_color=self._c_secondary,
+            hover_color=self._c_secondary_hover,
+            text_color="white",
+            font=self._fonts["btn"],
+            **kwargs
+        )
+
+    def _show_error_screen(self, message: str):
+        """Show a fallback screen with an error message and a way back home.
+        
+        Plain Tk widgets are used on purpose: this path runs when a screen
+        failed to build and does not need CustomTkinter's canvas-drawn styling.
+        """
+        # A screen may have failed halfway through being built or refreshed
+        self._reset_content()
+        
+        error_frame = tk.Frame(self.content_frame, bg=self._c_bg)
+        
+        error_label = tk.Label(
+            error_frame,
+            text=message,
+            fg="red",
+            bg=self._c_bg,
+            font=self._fonts["body"]
+        )
+        error_label.pack(pady=10)
+        
+        # Add a back button to return to home; Escape does the same
+        back_button = tk.Button(
+            error_frame,
+            text="Back to Home",
+            command=lambda: self._navigate(self.show_home),
+            bg=self._c_primary,
+            fg="white",
+            activebackground=self._c_primary_hover,
+            activeforeground="white",
+            relief="flat",
+            font=self._fonts["btn"]
+        )
+        back_button.pack(pady=10)
+        
+        error_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        self._current_panel = error_frame
+
+    def _set_settings_status(self, text, color, relwidth, duration):
+        """Show a message in the settings status label and hide it after duration ms."""
+        status_label = self._settings_status_label
+        status_label.configure(text=text, fg_color=color)
+        status_label.place(relx=0.5, rely=0.9, anchor="center", relwidth=relwidth, height=40)
+        
+        self._schedule_toast_hide(duration, status_label.place_forget)
+
+    def _schedule_toast_hide(self, delay, hide):
+        """Hide the current transient message after delay ms.
+        
+        Only one message timer is outstanding at a time: showing a new message
+        cancels the previous timer and hides the previous message immediately.
+        """
+        self._flush_toast()
+        
+        def run_hide():
+            self._pending_toast = None
+            hide()
+        
+        after_id = self.safe_after(delay, run_hide)
+        if after_id is not None:
+            self._pending_toast = (after_id, hide)
+
+    def _flush_toast(self):
+        """Cancel the pending message timer and hide its message now."""
+        if self._pending_toast is None:
+            return
+        after_id, hide = self._pending_toast
+        self._pending_toast = None
+        try:
+            self.root.after_cancel(after_id)
+            hide()
         except Exception as e:
-            self.logger.error(f"Error showing settings: {str(e)}")
-            # Create a basic error display if the settings frame creation fails
-            error_frame = ctk.CTkFrame(self.content_frame, fg_color=self.theme.get("bg", "#F0F4F8"))
-            error_frame.pack(fill="both", expand=True, padx=10, pady=10)
-            
-            error_label = ctk.CTkLabel(
-                error_frame,
-                text=f"Error loading settings: {str(e)}",
-                text_color="red",
-                font=ctk.CTkFont(size=14)
-            )
-            error_label.pack(pady=10)
-            
-            # Add a back button to return to home
-            back_button = ctk.CTkButton(
-                error_frame,
-                text="Back to Home",
-                command=self.show_home,
-                fg_color=self.theme.get("primary", "#4C51BF"),
-                hover_color=self.theme.get("primary_hover", "#3C41AF"),
-                text_color="white",
-                font=ctk.CTkFont(size=14, weight="bold")
-            )
-            back_button.pack(pady=10)
+            logger.debug("Error hiding pending message: %s", e)
 
+    @_screen("about", "Error loading about screen")
     def show_about(self):
         """Display the about screen with application information."""
-        try:
-            self.clear_content()
-            
-            # Create a frame for the about screen
-            about_frame = ctk.CTkFrame(self.content_frame, fg_color=self.theme.get("bg", "#F0F4F8"))
-            about_frame.pack(fill="both", expand=True, padx=10, pady=10)
-            
-            # Create top section with logo and app info
-            top_section = ctk.CTkFrame(about_frame, fg_color=self.theme.get("bg", "#F0F4F8"))
-            top_section.pack(fill="x", padx=20, pady=(20, 10))
-            
-            # Application Title with decorative element
-            title_frame = ctk.CTkFrame(top_section, fg_color=self.theme.get("accent", "#4C51BF"), corner_radius=10)
-            title_frame.pack(side="left", padx=(0, 20))
-            
-            # Add a mathematical symbol as decorative element
-            math_symbol = ctk.CTkLabel(
-                title_frame,
-                text="∫ ∑ ∂",
-                font=ctk.CTkFont(size=24, weight="bold"),
-                text_color="white"
-            )
-            math_symbol.pack(pady=20, padx=20)
-            
-            # App info container
-            app_info = ctk.CTkFrame(top_section, fg_color=self.theme.get("bg", "#F0F4F8"))
-            app_info.pack(side="left", fill="both", expand=True)
-            
-            title_label = ctk.CTkLabel(
-                app_info,
-                text="Numerical Analysis Application",
-                font=ctk.CTkFont(size=28, weight="bold"),
-                text_color=self.theme.get("text", "#1E293B"),
-                anchor="w"
+        # The About content is static, so build it once and re-attach it afterwards
+        self._show_screen("about", self._build_about_view)
+
+    def _build_about_view(self):
+        """Build the static About widget tree; it is detached, not destroyed, on navigation."""
+        # Bind theme colors and fonts once for the whole build
+        bg = self._c_bg
+        fg = self._c_fg
+        accent = self._c_accent
+        fonts = self._fonts
+        body_font = fonts["body"]
+        
+        # Create a frame for the about screen
+        about_frame = ctk.CTkFrame(self.content_frame, fg_color=bg)
+        
+        # Collect (widget, pack options) and lay everything out in one pass at the end
+        layout = []
+        
+        # Create top section with logo and app info
+        top_section = ctk.CTkFrame(about_frame, fg_color=bg)
+        layout.append((top_section, dict(fill="x", padx=20, pady=(20, 10))))
+        
+        # Application Title with decorative element
+        title_frame = ctk.CTkFrame(top_section, fg_color=accent, corner_radius=10)
+        layout.append((title_frame, dict(side="left", padx=(0, 20))))
+        
+        # Add a mathematical symbol as decorative element
+        math_symbol = ctk.CTkLabel(
+            title_frame,
+            text="∫ ∑ ∂",
+            font=fonts["title"],
+            text_color="white"
+        )
+        layout.append((math_symbol, dict(pady=20, padx=20)))
+        
+        # App info container
+        app_info = ctk.CTkFrame(top_section, fg_color=bg)
+        layout.append((app_info, dict(side="left", fill="both", expand=True)))
+        
+        title_label = ctk.CTkLabel(
+            app_info,
+            text="Numerical Analysis Application",
+            font=fonts["display"],
+            anchor="w"
+        )
+        layout.append((title_label, dict(fill="x", pady=(0, 5))))
+        
+        # Version text is formatted once whenever the version is assigned
+        version_label = ctk.CTkLabel(
+            app_info,
+            text=self._version_text,
+            font=body_font,
+            anchor="w"
+        )
+        layout.append((version_label, dict(fill="x", pady=(0, 5))))
+        
+        # Release date
+        release_date = ctk.CTkLabel(
+            app_info,
+            text=_ABOUT_RELEASE,
+            font=body_font,
+            anchor="w"
+        )
+        layout.append((release_date, dict(fill="x", pady=(0, 10))))
+        
+        # Divider
+        divider = ctk.CTkFrame(about_frame, height=2, fg_color=fg)
+        layout.append((divider, dict(fill="x", padx=20, pady=10)))
+        
+        # The static content fits the window as a 2x2 grid of cards, so a plain frame
+        # is enough; a scrollable frame would add a canvas, scrollbar and bindings
+        cards_frame = ctk.CTkFrame(about_frame, fg_color=bg)
+        cards_frame.grid_columnconfigure((0, 1), weight=1, uniform="about_cards")
+        layout.append((cards_frame, dict(fill="both", expand=True, padx=20, pady=5)))
+        
+        # Features Section
+        features_frame = ctk.CTkFrame(cards_frame, fg_color=fg, corner_radius=10)
+        features_frame.grid(row=0, column=0, sticky="nsew", padx=5, pady=5, ipady=10)
+        
+        features_title = ctk.CTkLabel(
+            features_frame,
+            text="Features",
+            font=fonts["section"],
+            text_color=accent
+        )
+        layout.append((features_title, dict(anchor="w", padx=15, pady=(10, 15))))
+        
+        # Feature list
+        for feature in _ABOUT_FEATURES:
+            feature_label = ctk.CTkLabel(
+                features_frame,
+                text=feature,
+                font=body_font,
+                anchor="w",
+                justify="left",
+                wraplength=320
             )
-            title_label.pack(fill="x", pady=(0, 5))
-            
-            # Version - safely handle if version is not defined
-            version = getattr(self, "version", "1.0.0")
-            version_label = ctk.CTkLabel(
-                app_info,
-                text=f"Version: {version}",
-                font=ctk.CTkFont(size=14),
-                text_color=self.theme.get("text", "#64748B"),
+            layout.append((feature_label, dict(fill="x", padx=15, pady=3)))
+        
+        # Implemented Methods Section
+        methods_frame = ctk.CTkFrame(cards_frame, fg_color=fg, corner_radius=10)
+        methods_frame.grid(row=0, column=1, sticky="nsew", padx=5, pady=5, ipady=10)
+        
+        methods_title = ctk.CTkLabel(
+            methods_frame,
+            text="Implemented Methods",
+            font=fonts["section"],
+            text_color=accent
+        )
+        layout.append((methods_title, dict(anchor="w", padx=15, pady=(10, 15))))
+        
+        # Methods grid - using two columns
+        methods_container = ctk.CTkFrame(methods_frame, fg_color="transparent")
+        layout.append((methods_container, dict(fill="x", padx=15, pady=5)))
+        
+        # Column 1
+        methods_col1 = ctk.CTkFrame(methods_container, fg_color="transparent")
+        layout.append((methods_col1, dict(side="left", fill="both", expand=True)))
+        
+        for method in _ABOUT_METHODS_LEFT:
+            method_label = ctk.CTkLabel(
+                methods_col1,
+                text=method,
+                font=body_font,
                 anchor="w"
             )
-            version_label.pack(fill="x", pady=(0, 5))
-            
-            # Release date
-            release_date = ctk.CTkLabel(
-                app_info,
-                text=f"Release Date: May 2024",
-                font=ctk.CTkFont(size=14),
-                text_color=self.theme.get("text", "#64748B"),
+            layout.append((method_label, dict(fill="x", pady=3)))
+        
+        # Column 2
+        methods_col2 = ctk.CTkFrame(methods_container, fg_color="transparent")
+        layout.append((methods_col2, dict(side="left", fill="both", expand=True)))
+        
+        for method in _ABOUT_METHODS_RIGHT:
+            method_label = ctk.CTkLabel(
+                methods_col2,
+                text=method,
+                font=body_font,
                 anchor="w"
             )
-            release_date.pack(fill="x", pady=(0, 10))
-            
-            # Divider
-            divider = ctk.CTkFrame(about_frame, height=2, fg_color=self.theme.get("fg", "#DDE4E6"))
-            divider.pack(fill="x", padx=20, pady=10)
-            
-            # Create a scrollable frame for content
-            scrollable_frame = ctk.CTkScrollableFrame(
-                about_frame, 
-                fg_color=self.theme.get("bg", "#F0F4F8"),
-                scrollbar_fg_color=self.theme.get("bg", "#F0F4F8"),
-                scrollbar_button_color=self.theme.get("accent", "#4C51BF")
-            )
-            scrollable_frame.pack(fill="both", expand=True, padx=20, pady=5)
-            
-            # Features Section
-            features_frame = ctk.CTkFrame(scrollable_frame, fg_color=self.theme.get("fg", "#DDE4E6"), corner_radius=10)
-            features_frame.pack(fill="x", pady=10, ipady=10)
-            
-            features_title = ctk.CTkLabel(
-                features_frame,
-                text="Features",
-                font=ctk.CTkFont(size=18, weight="bold"),
-                text_color=self.theme.get("accent", "#4C51BF")
-            )
-            features_title.pack(anchor="w", padx=15, pady=(10, 15))
-            
-            # Feature list
-            features = [
-                "📊 Multiple numerical methods for root finding and equation solving",
-                "📈 Interactive function plotting with error analysis",
-                "📋 Detailed step-by-step solution visualization",
-                "📁 Export results to various formats (CSV, Excel, PDF)",
-                "🔧 Customizable calculation settings and precision control",
-                "📱 Responsive interface with modern design",
-                "💾 Solution history for reviewing past calculations"
-            ]
-            
-            for feature in features:
-                feature_label = ctk.CTkLabel(
-                    features_frame,
-                    text=feature,
-                    font=ctk.CTkFont(size=14),
-                    text_color=self.theme.get("text", "#1E293B"),
-                    anchor="w"
-                )
-                feature_label.pack(fill="x", padx=15, pady=3)
-            
-            # Implemented Methods Section
-            methods_frame = ctk.CTkFrame(scrollable_frame, fg_color=self.theme.get("fg", "#DDE4E6"), corner_radius=10)
-            methods_frame.pack(fill="x", pady=10, ipady=10)
-            
-            methods_title = ctk.CTkLabel(
-                methods_frame,
-                text="Implemented Methods",
-                font=ctk.CTkFont(size=18, weight="bold"),
-                text_color=self.theme.get("accent", "#4C51BF")
-            )
-            methods_title.pack(anchor="w", padx=15, pady=(10, 15))
-            
-            # Methods grid - using two columns
-            methods_container = ctk.CTkFrame(methods_frame, fg_color="transparent")
-            methods_container.pack(fill="x", padx=15, pady=5)
-            
-            # Column 1
-            methods_col1 = ctk.CTkFrame(methods_container, fg_color="transparent")
-            methods_col1.pack(side="left", fill="both", expand=True)
-            
-            methods1 = [
-                "• Bisection Method",
-                "• Newton-Raphson Method",
-                "• Secant Method",
-                "• Fixed-Point Iteration"
-            ]
-            
-            for method in methods1:
-                method_label = ctk.CTkLabel(
-                    methods_col1,
-                    text=method,
-                    font=ctk.CTkFont(size=14),
-                    text_color=self.theme.get("text", "#1E293B"),
-                    anchor="w"
-                )
-                method_label.pack(fill="x", pady=3)
-            
-            # Column 2
-            methods_col2 = ctk.CTkFrame(methods_container, fg_color="transparent")
-            methods_col2.pack(side="left", fill="both", expand=True)
-            
-            methods2 = [
-                "• Gauss Elimination",
-                "• Gauss-Jordan Method",
-                "• LU Decomposition",
-                "• Cramer's Rule"
-            ]
-            
-            for method in methods2:
-                method_label = ctk.CTkLabel(
-                    methods_col2,
-                    text=method,
-                    font=ctk.CTkFont(size=14),
-                    text_color=self.theme.get("text", "#1E293B"),
-                    anchor="w"
-                )
-                method_label.pack(fill="x", pady=3)
-            
-            # Technology Section
-            tech_frame = ctk.CTkFrame(scrollable_frame, fg_color=self.theme.get("fg", "#DDE4E6"), corner_radius=10)
-            tech_frame.pack(fill="x", pady=10, ipady=10)
-            
-            tech_title = ctk.CTkLabel(
+            layout.append((method_label, dict(fill="x", pady=3)))
+        
+        # Technology Section
+        tech_frame = ctk.CTkFrame(cards_frame, fg_color=fg, corner_radius=10)
+        tech_frame.grid(row=1, column=0, sticky="nsew", padx=5, pady=5, ipady=10)
+        
+        tech_title = ctk.CTkLabel(
+            tech_frame,
+            text="Technology Stack",
+            font=fonts["section"],
+            text_color=accent
+        )
+        layout.append((tech_title, dict(anchor="w", padx=15, pady=(10, 15))))
+        
+        for item in _ABOUT_TECH_ITEMS:
+            tech_label = ctk.CTkLabel(
                 tech_frame,
-                text="Technology Stack",
-                font=ctk.CTkFont(size=18, weight="bold"),
-                text_color=self.theme.get("accent", "#4C51BF")
-            )
-            tech_title.pack(anchor="w", padx=15, pady=(10, 15))
-            
-            tech_items = [
-                "• Python - Core programming language",
-                "• CustomTkinter - Modern UI framework",
-                "• NumPy - Numerical computations and array operations",
-                "• Matplotlib - Data visualization and plotting",
-                "• SymPy - Symbolic mathematics for equation parsing"
-            ]
-            
-            for item in tech_items:
-                tech_label = ctk.CTkLabel(
-                    tech_frame,
-                    text=item,
-                    font=ctk.CTkFont(size=14),
-                    text_color=self.theme.get("text", "#1E293B"),
-                    anchor="w"
-                )
-                tech_label.pack(fill="x", padx=15, pady=3)
-            
-            # Credits section 
-            credits_frame = ctk.CTkFrame(scrollable_frame, fg_color=self.theme.get("fg", "#DDE4E6"), corner_radius=10)
-            credits_frame.pack(fill="x", pady=10, ipady=10)
-            
-            credits_title = ctk.CTkLabel(
-                credits_frame,
-                text="Credits & Contributors",
-                font=ctk.CTkFont(size=18, weight="bold"),
-                text_color=self.theme.get("accent", "#4C51BF")
-            )
-            credits_title.pack(anchor="w", padx=15, pady=(10, 15))
-            
-            credits_info = ctk.CTkLabel(
-                credits_frame,
-                text="Developed by Hosam Dyab and Hazem Mohamed\nSpecial thanks to all numerical analysis and scientific computing communities",
-                font=ctk.CTkFont(size=14),
-                text_color=self.theme.get("text", "#1E293B")
-            )
-            credits_info.pack(padx=15, pady=5)
-            
-            # Create button container
-            button_container = ctk.CTkFrame(about_frame, fg_color=self.theme.get("bg", "#F0F4F8"))
-            button_container.pack(fill="x", pady=15)
-            
-            # Back Button
-            back_button = ctk.CTkButton(
-                button_container,
-                text="Back to Home",
-                command=self.show_home,
-                fg_color=self.theme.get("primary", "#4C51BF"),
-                hover_color=self.theme.get("primary_hover", "#3C41AF"),
-                text_color="white",
-                font=ctk.CTkFont(size=14, weight="bold"),
-                height=38,
-                corner_radius=8
+                text=item,
+                font=body_font,
+                anchor="w",
+                justify="left",
+                wraplength=320
             )
-            back_button.pack(padx=20, pady=10)
-            
-        except Exception as e:
-            self.logger.error(f"Error showing about screen: {str(e)}")
-            # Create a basic error display if the about frame creation fails
-            error_frame = ctk.CTkFrame(self.content_frame, fg_color=self.theme.get("bg", "#F0F4F8"))
-            error_frame.pack(fill="both", expand=True, padx=10, pady=10)
-            
-            error_label = ctk.CTkLabel(
-                error_frame,
-                text=f"Error loading about screen: {str(e)}",
-                text_color="red",
-                font=ctk.CTkFont(size=14)
-            )
-            error_label.pack(pady=10)
-            
-            # Add a back button to return to home
-            back_button = ctk.CTkButton(
-                error_frame,
-                text="Back to Home",
-                command=self.show_home,
-                fg_color=self.theme.get("primary", "#4C51BF"),
-                hover_color=self.theme.get("primary_hover", "#3C41AF"),
-                text_color="white",
-                font=ctk.CTkFont(size=14, weight="bold")
-            )
-            back_button.pack(pady=10)
+            layout.append((tech_label, dict(fill="x", padx=15, pady=3)))
+        
+        # Credits section 
+        credits_frame = ctk.CTkFrame(cards_frame, fg_color=fg, corner_radius=10)
+        credits_frame.grid(row=1, column=1, sticky="nsew", padx=5, pady=5, ipady=10)
+        
+        credits_title = ctk.CTkLabel(
+            credits_frame,
+            text="Credits & Contributors",
+            font=fonts["section"],
+            text_color=accent
+        )
+        layout.append((credits_title, dict(anchor="w", padx=15, pady=(10, 15))))
+        
+        credits_info = ctk.CTkLabel(
+            credits_frame,
+            text=_ABOUT_CREDITS,
+            font=body_font,
+            justify="left",
+            wraplength=320
+        )
+        layout.append((credits_info, dict(padx=15, pady=5)))
+        
+        # Create button container
+        button_container = ctk.CTkFrame(about_frame, fg_color=bg)
+        layout.append((button_container, dict(fill="x", pady=15)))
+        
+        # Back Button
+        back_button = self._primary_button(
+            button_container,
+            "Back to Home",
+            lambda: self._navigate(self.show_home),
+            height=38,
+            corner_radius=8
+        )
+        layout.append((back_button, dict(padx=20, pady=10)))
+        
+        for widget, pack_options in layout:
+            widget.pack(**pack_options)
+        
+        # Only cache the view once it has been built completely
+        self._screens["about"] = about_frame
 
     def check_dpi_scaling(self):
-        """Check and adjust for high DPI displays."""
+        """Check and adjust for high DPI displays.
+        
+        Scaling is only changed on screens larger than Full HD. On standard
+        displays CustomTkinter's default factor of 1.0 is left untouched, since
+        setting it again would rescale and redraw every existing widget for no
+        visual change. The app does support HiDPI, so the factor is not pinned
+        to 1.0 on large screens; all fonts come from the shared self._fonts
+        objects, so a scaling change updates a handful of fonts rather than one
+        per widget.
+        """
         try:
             # Skip DPI scaling check completely if shutting down
             if getattr(self, 'is_shutting_down', False):
@@ -2455,7 +2416,7 @@ class NumericalApp:
                     self.root.after_cancel(self.after_ids["check_dpi_scaling"])
                     del self.after_ids["check_dpi_scaling"]
                 except Exception as e:
-                    self.logger.debug(f"Error canceling check_dpi_scaling callback: {e}")
+                    logger.debug("Error canceling check_dpi_scaling callback: %s", e)
             
             # Get screen width and height
             screen_width = self.root.winfo_screenwidth()
@@ -2465,22 +2426,22 @@ class NumericalApp:
             if screen_width > 2560 or screen_height > 1440:  # 2K+ resolution
                 ctk.set_widget_scaling(1.2)  # Increase widget size by 20%
                 ctk.set_window_scaling(1.1)  # Increase window size by 10%
-                self.logger.info(f"Adjusted scaling for high DPI display: {screen_width}x{screen_height}")
+                logger.info("Adjusted scaling for high DPI display: %sx%s", screen_width, screen_height)
             elif screen_width > 1920 or screen_height > 1080:  # Full HD+
                 ctk.set_widget_scaling(1.1)  # Increase widget size by 10%
-                self.logger.info(f"Adjusted scaling for Full HD+ display: {screen_width}x{screen_height}")
+                logger.info("Adjusted scaling for Full HD+ display: %sx%s", screen_width, screen_height)
                 
         except Exception as e:
             # Only log warning if not shutting down
             if not getattr(self, 'is_shutting_down', False):
-                self.logger.warning(f"Failed to adjust DPI scaling: {e}")
+                logger.warning("Failed to adjust DPI scaling: %s", e)
 
     def cleanup(self):
         """Clean up resources and cancel scheduled events before closing."""
         try:
             # Set the shutdown flag first to prevent new callbacks
             self.is_shutting_down = True
-            self.logger.info("Starting application cleanup...")
+            logger.info("Starting application cleanup...")
             
             # Stop any pending UI updates
             if hasattr(self, 'root') and self.root.winfo_exists():
@@ -2492,9 +2453,9 @@ class NumericalApp:
                 try:
                     if hasattr(self, 'root') and self.root.winfo_exists():
                         self.root.after_cancel(after_id)
-                        self.logger.debug(f"Cancelled after event: {after_id_name}")
+                        logger.debug("Cancelled after event: %s", after_id_name)
                 except Exception as e:
-                    self.logger.debug(f"Error cancelling after event {after_id_name}: {e}")
+                    logger.debug("Error cancelling after event %s: %s", after_id_name, e)
             
             # Clear after IDs dictionary
             self.after_ids.clear()
@@ -2511,13 +2472,13 @@ class NumericalApp:
                             id_to_cancel = int(widget_id)
                             if id_to_cancel > 0:
                                 self.root.after_cancel(id_to_cancel)
-                                self.logger.debug(f"Cancelled unnamed after event: {id_to_cancel}")
+                                logger.debug("Cancelled unnamed after event: %s", id_to_cancel)
                         except (ValueError, TypeError) as e:
-                            self.logger.debug(f"Invalid after ID {widget_id}: {e}")
+                            logger.debug("Invalid after ID %s: %s", widget_id, e)
                         except Exception as e:
-                            self.logger.debug(f"Error cancelling after ID {widget_id}: {e}")
+                            logger.debug("Error cancelling after ID %s: %s", widget_id, e)
             except Exception as e:
-                self.logger.debug(f"Error during after events cleanup: {e}")
+                logger.debug("Error during after events cleanup: %s", e)
             
             # Additional cleanup for threads and resources
             if hasattr(self, 'calculation_thread') and getattr(self, 'calculation_thread', None) is not None:
@@ -2527,9 +2488,9 @@ class NumericalApp:
             # Wait a brief moment to ensure all cancellations take effect
             time.sleep(0.1)
             
-            self.logger.info("Application cleanup completed successfully")
-        except Exception as e:
-            self.logger.error(f"Error during application cleanup: {e}")
+            logger.info("Application cleanup completed successfully")
+        except Exception:
+            logger.exception("Error during application cleanup")
             
     def run(self):
         """Run the application main loop."""
@@ -2539,11 +2500,11 @@ class NumericalApp:
             
             # Start the main event loop
             self.root.mainloop()
-        except Exception as e:
+        except Exception:
             # Attempt cleanup
             self.is_shutting_down = True
             self.cleanup()
-            self.logger.error(f"Error running application: {str(e)}")
+            logger.exception("Error running application")
             raise
 
     def safe_after(self, delay, callback, after_id_name=None):
@@ -2571,10 +2532,10 @@ class NumericalApp:
             if not getattr(self, 'is_shutting_down', False) and hasattr(self, 'root') and self.root.winfo_exists():
                 try:
                     callback()
-                except Exception as e:
-                    self.logger.error(f"Error in delayed callback: {str(e)}")
+                except Exception:
+                    logger.exception("Error in delayed callback")
             else:
-                self.logger.debug(f"Skipped callback execution - application shutting down or destroyed")
+                logger.debug("Skipped callback execution - application shutting down or destroyed")
         
         # Schedule the callback
         after_id = self.root.after(delay, safe_callback_wrapper)
@@ -1,9 +1,13 @@
 import customtkinter as ctk
-from typing import Dict, Optional
+from tkinter import ttk
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Tuple
 import logging
+import os
 
 class ThemeManager:
-    LIGHT_MODE: Dict[str, str] = {
+    # Read-only, so a screen cannot change the shared palette by accident
+    LIGHT_MODE: Mapping[str, str] = MappingProxyType({
         "bg": "#F0F4F8",       # Soft light gray
         "fg": "#DDE4E6",       # Lighter gray for sidebar
         "text": "#2D3748",     # Dark gray for readability
@@ -19,21 +23,92 @@ class ThemeManager:
         "table_odd_row": "#F8FAFC", # Very light gray for odd rows
         "table_even_row": "#FFFFFF", # White for even rows
         "table_hover": "#E2E8F0" # Light gray for hover
-    }
+    })
 
-    def __init__(self):
+    # CustomTkinter color theme based on 'blue'; each color is a [light, dark] pair
+    COLOR_THEME_FILE = os.path.join(os.path.dirname(__file__), "numerical_theme.json")
+
+    # Color theme options whose light color comes from the palette, so the palette
+    # above stays the only place these colors are written down
+    CTK_PALETTE_KEYS: Mapping[Tuple[str, str], str] = MappingProxyType({
+        ("CTkButton", "fg_color"): "primary",
+        ("CTkButton", "hover_color"): "primary_hover",
+        ("CTkLabel", "text_color"): "text",
+        ("CTkOptionMenu", "fg_color"): "button",
+        ("CTkOptionMenu", "button_color"): "button_hover",
+        ("CTkOptionMenu", "button_hover_color"): "accent",
+        ("DropdownMenu", "fg_color"): "bg",
+        ("CTkSwitch", "fg_color"): "bg",
+        ("CTkSwitch", "progress_color"): "accent",
+        ("CTkSwitch", "button_color"): "fg",
+        ("CTkSwitch", "button_hover_color"): "fg",
+    })
+
+    def __init__(self, root=None):
+        """
+        Args:
+            root: Tk root window whose interpreter the ttk styles are configured in
+        """
         self.logger = logging.getLogger(__name__)
-        self.themes = {
+        self.root = root
+        # ttk.Style for root and the options last sent to Tk for each style name;
+        # both belong to this root's interpreter, so they live on the instance
+        self._ttk_style: Optional[ttk.Style] = None
+        self._applied_styles: Dict[str, Dict[str, Any]] = {}
+        self.themes = MappingProxyType({
             "Light": self.LIGHT_MODE
-        }
+        })
         self.current_theme = "Light"
         try:
             ctk.set_appearance_mode("light")
-            ctk.set_default_color_theme("blue")
+            self._load_color_theme(self.themes[self.current_theme])
         except Exception as e:
             self.logger.error(f"Error initializing theme: {str(e)}")
             raise
 
+    def _load_color_theme(self, theme: Mapping[str, str]) -> None:
+        """
+        Make COLOR_THEME_FILE the CustomTkinter default, with the light colors
+        listed in CTK_PALETTE_KEYS taken from theme; widgets created afterwards use them.
+        """
+        ctk.set_default_color_theme(self.COLOR_THEME_FILE)
+        widget_themes = ctk.ThemeManager.theme
+        for (widget_name, option), palette_key in self.CTK_PALETTE_KEYS.items():
+            dark = widget_themes[widget_name][option][1]
+            widget_themes[widget_name][option] = [theme[palette_key], dark]
+
+    @property
+    def ttk_style(self) -> ttk.Style:
+        """The ttk.Style of the root window, created on first use."""
+        if self._ttk_style is None:
+            self._ttk_style = ttk.Style(master=self.root)
+        return self._ttk_style
+
+    def configure_style(self, style_name: str, **options: Any) -> None:
+        """
+        Configure a ttk style, sending only the options whose values changed.
+        
+        Every style.configure call is a Tcl round-trip and makes ttk redraw the
+        widgets using the style, so repeated calls with the same values are skipped.
+        All configuration of shared styles should go through here to keep the
+        record accurate.
+        """
+        applied = self._applied_styles.setdefault(style_name, {})
+        changed = {key: value for key, value in options.items() if applied.get(key) != value}
+        if not changed:
+            return
+        
+        self.ttk_style.configure(style_name, **changed)
+        applied.update(changed)
+
+    @staticmethod
+    def changed_keys(old_theme: Dict[str, str], new_theme: Dict[str, str]) -> FrozenSet[str]:
+        """Return the theme keys whose colors differ between two theme dictionaries."""
+        return frozenset(
+            key for key in old_theme.keys() | new_theme.keys()
+            if old_theme.get(key) != new_theme.get(key)
+        )
+
     def apply_theme(self) -> Dict[str, str]:
         """Apply the current theme and return the theme dictionary."""
         try:
@@ -63,7 +138,7 @@ class ThemeManager:
             # Always use light appearance mode since we only have light theme now
             ctk.set_appearance_mode("light")
             # Force update the default color theme
-            ctk.set_default_color_theme("blue")
+            self._load_color_theme(self.themes[theme_name])
             # Return the new theme dictionary
             return self.themes[theme_name]
         except Exception as e:
@@ -1,8 +1,11 @@
 import customtkinter as ctk
-from typing import Dict, Callable
+from typing import AbstractSet, Callable, Dict, Optional
 import logging
 
 class Sidebar:
+    # Theme keys used by update_theme
+    THEME_KEYS = frozenset({"fg", "text", "button", "button_hover"})
+
     def __init__(self, parent, theme: Dict[str, str], home_cb: Callable, history_cb: Callable, 
                  settings_cb: Callable, about_cb: Callable):
         """
@@ -32,6 +35,7 @@ class Sidebar:
                 text_color=theme["text"]
             )
             title_label.pack(pady=(20, 30))
+            self._title_label = title_label
             
             # Navigation buttons with consistent styling
             buttons = [
@@ -41,6 +45,8 @@ class Sidebar:
                 ("About", about_cb)
             ]
             
+            # Kept so update_theme can re-color them without walking the widget tree
+            self._buttons = []
             for text, command in buttons:
                 btn = ctk.CTkButton(
                     self.widget,
@@ -55,32 +61,34 @@ class Sidebar:
                     corner_radius=8  # Rounded corners for modern look
                 )
                 btn.pack(pady=10, padx=20)
+                self._buttons.append(btn)
                 
         except Exception as e:
             self.logger.error(f"Error initializing sidebar: {str(e)}")
             raise
 
-    def update_theme(self, theme: Dict[str, str]) -> None:
+    def update_theme(self, theme: Dict[str, str], changed_keys: Optional[AbstractSet[str]] = None) -> None:
         """
         Update the theme colors of the sidebar.
         
         Args:
             theme: Dictionary containing new theme colors
+            changed_keys: Keys that differ from the previous theme; None means all
         """
         try:
             self.theme = theme
+            if changed_keys is not None and not changed_keys & self.THEME_KEYS:
+                return
             self.widget.configure(fg_color=theme["fg"])
             
-            # Update all widgets in the sidebar
-            for widget in self.widget.winfo_children():
-                if isinstance(widget, ctk.CTkButton):
-                    widget.configure(
-                        fg_color=theme["button"],
-                        hover_color=theme["button_hover"],
-                        text_color="#FFFFFF"  # White text for better contrast
-                    )
-                elif isinstance(widget, ctk.CTkLabel):
-                    widget.configure(text_color=theme["text"])
+            # Update the navigation buttons and the title
+            for button in self._buttons:
+                button.configure(
+                    fg_color=theme["button"],
+                    hover_color=theme["button_hover"],
+                    text_color="#FFFFFF"  # White text for better contrast
+                )
+            self._title_label.configure(text_color=theme["text"])
         except Exception as e:
             self.logger.error(f"Error updating sidebar theme: {str(e)}")
             raise
\ No newline at end of file
@@ -9,7 +9,13 @@ import math
 from collections import OrderedDict
 
 class ResultTable:
-    def __init__(self, parent, theme=None, height=None, width=None, fixed_position=False):
+    # Theme keys used by update_theme
+    THEME_KEYS = frozenset({"bg", "table_hover", "table_bg", "table_fg", "table_heading_bg", "table_heading_fg"})
+    
+    # Rows inserted per event-loop turn; the first batch covers the visible part of the table
+    FILL_BATCH = 100
+
+    def __init__(self, parent, theme=None, height=None, width=None, fixed_position=False, theme_manager=None):
         """
         Initialize the result table.
         
@@ -19,8 +25,10 @@ class ResultTable:
             height: Optional height constraint
             width: Optional width constraint
             fixed_position: Whether to use a fixed position that doesn't expand
+            theme_manager: ThemeManager whose cached ttk style the table style is set through
         """
         self.theme = theme or {}
+        self.theme_manager = theme_manager
         self.logger = logging.getLogger(__name__)
         self.fixed_position = fixed_position
         
@@ -89,8 +97,7 @@ class ResultTable:
         self.table.tag_configure('result', background="#F0F9FF", foreground="#0369A1", font=('Helvetica', 10, 'bold'))
         
         # Configure row height and padding for all rows - reduced height
-        style = ttk.Style()
-        style.configure("Custom.Treeview", rowheight=28)  # Reduced from 35 to 28
+        self._configure_style("Custom.Treeview", rowheight=28)  # Reduced from 35 to 28
         
         # Bind hover events
         self.table.bind('<Motion>', self._on_motion)
@@ -102,6 +109,13 @@ class ResultTable:
         # Initialize column sort state
         self.sort_columns = {}  # {column_id: ascending}
         
+        # Formatted (values, tags) rows still waiting to be inserted, and the job inserting them
+        self._pending_rows = []
+        self._fill_job = None
+        
+        # Formatted history rows currently shown, or None when the table shows other data
+        self._shown_history = None
+        
         # Bind header click for sorting
         self.table.bind("<Button-1>", self._on_header_click)
         
@@ -221,6 +235,9 @@ class ResultTable:
         try:
             region = self.table.identify_region(event.x, event.y)
             if region == "heading":
+                # Sorting reads the rows back from the Treeview, so they must all be there
+                self._finish_fill()
+                
                 column = self.table.identify_column(event.x)
                 column_id = self.table["columns"][int(column.replace('#', '')) - 1]
                 
@@ -235,9 +252,8 @@ class ResultTable:
                     tags = self.table.item(item, "tags")
                     data.append((values, tags))
                 
-                # Remove all items
-                for item in self.table.get_children():
-                    self.table.delete(item)
+                # Remove all items in a single call
+                self.table.delete(*self.table.get_children())
                 
                 # Sort data by the selected column
                 col_idx = self.table["columns"].index(column_id)
@@ -265,18 +281,11 @@ class ResultTable:
                 numeric_rows.sort(key=lambda x: x[2], reverse=not ascending)
                 text_rows.sort(key=lambda x: x[2], reverse=not ascending)
                 
-                # Add back in sorted order: numeric, text, special
-                for values, tags, _ in numeric_rows:
-                    item = self.table.insert("", "end", values=values)
-                    self.table.item(item, tags=tags)
-                    
-                for values, tags, _ in text_rows:
-                    item = self.table.insert("", "end", values=values)
-                    self.table.item(item, tags=tags)
-                    
-                for values, tags in special_rows:
-                    item = self.table.insert("", "end", values=values)
-                    self.table.item(item, tags=tags)
+                # Add back in sorted order: numeric, text, special; values and tags
+                # go in with the insert instead of a second item() call per row
+                self._insert_now((values, tags) for values, tags, _ in numeric_rows)
+                self._insert_now((values, tags) for values, tags, _ in text_rows)
+                self._insert_now(special_rows)
                 
                 # Update column headers to show sort direction
                 for col in self.table["columns"]:
@@ -291,14 +300,23 @@ class ResultTable:
         except Exception as e:
             self.logger.error(f"Error sorting table: {str(e)}")
 
-    def update_theme(self, theme):
-        """Update the table theme colors."""
+    def _configure_style(self, style_name, **options):
+        """Configure a ttk style through the theme manager, which skips unchanged options."""
+        if self.theme_manager is not None:
+            self.theme_manager.configure_style(style_name, **options)
+        else:
+            ttk.Style(master=self.table).configure(style_name, **options)
+
+    def update_theme(self, theme, changed_keys=None):
+        """Update the table theme colors; skipped when changed_keys holds none of THEME_KEYS."""
         try:
             # Check if widgets still exist
             if not hasattr(self, "table_frame") or not self.table_frame.winfo_exists():
                 return
                 
             self.theme = theme
+            if changed_keys is not None and not changed_keys & self.THEME_KEYS:
+                return
             
             # Update frame colors
             self.table_frame.configure(fg_color=self.theme.get("bg", "#F0F4F8"))
@@ -319,38 +337,17 @@ class ResultTable:
                 # Make result rows more prominent with a highlighted background
                 self.table.tag_configure('result', background="#6247AA", foreground="#FFFFFF", font=('Helvetica', 10, 'bold'))
                 
-                # Update table style while preserving row height
-                style = ttk.Style()
-                current_rowheight = style.lookup("Custom.Treeview", "rowheight")
-                
-                style.configure("Custom.Treeview",
+                # Update table colors; the row height is left as it is
+                self._configure_style("Custom.Treeview",
                               background=self.theme.get("table_bg", "#FFFFFF"),  # Use plain white background
                               foreground=self.theme.get("table_fg", "#1E293B"),
-                              fieldbackground=self.theme.get("table_bg", "#FFFFFF"),  # Use plain white background
-                              rowheight=current_rowheight or 28)  # Maintain current row height or use default
+                              fieldbackground=self.theme.get("table_bg", "#FFFFFF"))  # Use plain white background
                 
-                style.configure("Custom.Treeview.Heading",
+                self._configure_style("Custom.Treeview.Heading",
                               background=self.theme.get("table_heading_bg", "#E2E8F0"),
                               foreground=self.theme.get("table_heading_fg", "#1E293B"))
                 
-                # Reapply row colors to existing rows
-                for idx, item in enumerate(self.table.get_children()):
-                    # Get current tags
-                    tags = list(self.table.item(item, "tags"))
-                    
-                    # Filter out row coloring tags
-                    tags = [tag for tag in tags if tag not in ('oddrow', 'evenrow')]
-                    
-                    # Add appropriate row tag
-                    if "info" in tags or "warning" in tags or "error" in tags or "success" in tags or "result" in tags:
-                        # Preserve special row tags
-                        pass
-                    else:
-                        # Add row coloring - plain white for all
-                        tags.append('evenrow')
-                    
-                    # Update tags
-                    self.table.item(item, tags=tags)
+                # Row colors come from the tag configuration above, so existing rows need no per-row update
             
         except Exception as e:
             self.logger.error(f"Error updating table theme: {str(e)}")
@@ -535,10 +532,10 @@ class ResultTable:
             
             # If matrix data is detected, configure a larger row height
             if contains_matrix:
-                style = ttk.Style()
-                style.configure("Custom.Treeview", rowheight=90)  # Increased from 70 to 90 for matrices
+                self._configure_style("Custom.Treeview", rowheight=90)  # Increased from 70 to 90 for matrices
             
-            # Iterate through each row
+            # Format every row first; they are inserted in batches afterwards
+            rows = []
             for idx, row in df_data.iterrows():
                 values = []
                 
@@ -606,8 +603,9 @@ class ResultTable:
                     if 'result' not in tags:
                         tags.append('result')
                 
-                # Insert the row with values and tags
-                self.table.insert("", "end", values=values, tags=tags)
+                rows.append((values, tags))
+            
+            self._fill_rows(rows)
                 
             # Show horizontal scrollbar if needed
             table_width = sum(int(self.table.column(col, "width")) for col in column_ids)
@@ -631,42 +629,24 @@ class ResultTable:
         """
         Display history entries in the table.
         
+        When the table already shows history in its original order, only the
+        rows that changed are updated, so saving one solution inserts one row.
+        
         Args:
             history: List of history entries
         """
         try:
-            # Clear existing data
-            self.clear()
-            
             if not history or len(history) == 0:
                 # Display message for empty history
+                self.clear()
                 self.table["columns"] = ["Info"]
                 self.table.column("Info", width=400, anchor="center")
                 self.table.heading("Info", text="Information")
                 self.table.insert("", "end", values=["No history entries found"], tags=("info",))
                 return
             
-            # Configure columns
-            columns = ["Index", "Date", "Time", "Method", "Function", "Root", "Tags"]
-            self.table["columns"] = columns
-            
-            # Set column widths and headings
-            col_widths = {
-                "Index": 60,
-                "Date": 100,
-                "Time": 100,
-                "Method": 150,
-                "Function": 250,
-                "Root": 150,
-                "Tags": 150
-            }
-            
-            for col in columns:
-                width = col_widths.get(col, 150)
-                self.table.column(col, width=width, minwidth=60, anchor="center")
-                self.table.heading(col, text=col, anchor="center")
-            
-            # Insert history entries
+            # Format history entries; they are inserted in batches afterwards
+            rows = []
             for idx, entry in enumerate(history):
                 # Format root value(s)
                 root = entry.get("root", "")
@@ -692,7 +672,39 @@ class ResultTable:
                 
                 # Insert with alternating row colors
                 tag = "evenrow" if idx % 2 == 0 else "oddrow"
-                self.table.insert("", "end", values=values, tags=(tag,))
+                rows.append((values, (tag,)))
+            
+            # Reuse the existing items unless the table shows something else or was re-sorted
+            if self._shown_history is not None and not self.sort_columns:
+                self._update_rows(self._shown_history, rows)
+                self._shown_history = rows
+                return
+            
+            # Clear existing data
+            self.clear()
+            
+            # Configure columns
+            columns = ["Index", "Date", "Time", "Method", "Function", "Root", "Tags"]
+            self.table["columns"] = columns
+            
+            # Set column widths and headings
+            col_widths = {
+                "Index": 60,
+                "Date": 100,
+                "Time": 100,
+                "Method": 150,
+                "Function": 250,
+                "Root": 150,
+                "Tags": 150
+            }
+            
+            for col in columns:
+                width = col_widths.get(col, 150)
+                self.table.column(col, width=width, minwidth=60, anchor="center")
+                self.table.heading(col, text=col, anchor="center")
+            
+            self._fill_rows(rows)
+            self._shown_history = rows
                 
             # Show horizontal scrollbar if needed
             table_width = sum(int(self.table.column(col, "width")) for col in columns)
@@ -712,14 +724,81 @@ class ResultTable:
             self.table.heading("Error", text="Error")
             self.table.insert("", "end", values=[f"Error displaying history: {str(e)}"], tags=("error",))
 
+    def _update_rows(self, old_rows, new_rows):
+        """Turn the displayed old_rows into new_rows, touching only items that differ."""
+        self._finish_fill()
+        items = self.table.get_children()
+        
+        for item, old_row, new_row in zip(items, old_rows, new_rows):
+            if old_row != new_row:
+                values, tags = new_row
+                self.table.item(item, values=values, tags=tags)
+        
+        if len(items) > len(new_rows):
+            self.table.delete(*items[len(new_rows):])
+        elif len(new_rows) > len(items):
+            self._fill_rows(new_rows[len(items):])
+
+    def _fill_rows(self, rows):
+        """Insert the first FILL_BATCH rows now and the rest from the event loop.
+        
+        Long iteration tables then show their first screen at once instead of
+        blocking the UI until every row has been inserted.
+        """
+        self._cancel_fill()
+        self._pending_rows = rows
+        self._insert_batch()
+
+    def _insert_batch(self):
+        """Insert the next FILL_BATCH pending rows and schedule the following batch."""
+        self._fill_job = None
+        if not self.table.winfo_exists():
+            self._pending_rows = []
+            return
+        
+        batch = self._pending_rows[:self.FILL_BATCH]
+        del self._pending_rows[:self.FILL_BATCH]
+        self._insert_now(batch)
+        
+        if self._pending_rows:
+            self._fill_job = self.table.after_idle(self._insert_batch)
+
+    def _finish_fill(self):
+        """Insert all pending rows now, for code that reads every row back from the Treeview."""
+        self._cancel_fill()
+        rows, self._pending_rows = self._pending_rows, []
+        self._insert_now(rows)
+
+    def _insert_now(self, rows):
+        """Append (values, tags) rows to the Treeview.
+        
+        Calls the Tcl insert command directly: Treeview.insert re-parses its
+        keyword options for every row, and tkinter already converts the values
+        tuple to a properly quoted Tcl list.
+        """
+        call = self.table.tk.call
+        path = str(self.table)
+        for values, tags in rows:
+            call(path, "insert", "", "end", "-values", tuple(values), "-tags", tuple(tags))
+
+    def _cancel_fill(self):
+        """Stop the scheduled batch insert, keeping the pending rows."""
+        if self._fill_job is not None:
+            self.table.after_cancel(self._fill_job)
+            self._fill_job = None
+
     def clear(self):
         """Clear the table."""
         try:
             # Check if the table exists
             if hasattr(self, "table") and self.table.winfo_exists():
-                # Delete all items
-                for item in self.table.get_children():
-                    self.table.delete(item)
+                # Drop rows that were still waiting to be inserted
+                self._cancel_fill()
+                self._pending_rows = []
+                self._shown_history = None
+                
+                # Delete all items in a single call
+                self.table.delete(*self.table.get_children())
                     
                 # Reset columns
                 self.table["columns"] = []
@@ -770,6 +849,8 @@ class ResultTable:
             columns = self.table["columns"]
             if not columns:
                 return False
+            
+            self._finish_fill()
                 
             # Get all rows
             rows = []
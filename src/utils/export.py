@@ -1,9 +1,9 @@
 from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+from reportlab.platypus import SimpleDocTemplate, LongTable, TableStyle, Paragraph, Spacer
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable
 import os
 import re
 from datetime import datetime
@@ -19,11 +19,24 @@ def sanitize_filename(filename: str) -> str:
         sanitized = sanitized[:100]
     return sanitized
 
-def format_table_data(table_data: List[Dict[str, Any]]) -> List[List[str]]:
+def _format_cell(header: str, value: Any) -> str:
+    """Convert a single table value to its PDF string representation."""
+    # Special handling for matrix data
+    if header == "Matrix" and isinstance(value, str):
+        # Preserve line breaks in matrix representations
+        # Replace multiple spaces with non-breaking spaces to maintain alignment
+        return value.replace("  ", " \xa0")
+    # Format floats with consistent decimal places
+    if isinstance(value, float):
+        return f"{value:.6f}"
+    return str(value)
+
+def format_table_data(table_data: Iterable[Dict[str, Any]]) -> List[List[str]]:
     """
     Format table data for PDF export with proper handling of different data types,
-    especially for matrix data.
+    especially for matrix data. The first row of the result is the header row.
     """
+    table_data = list(table_data)
     if not table_data:
         return [["Message"], ["No data available"]]
         
@@ -36,34 +49,16 @@ def format_table_data(table_data: List[Dict[str, Any]]) -> List[List[str]]:
     # Format each row
     formatted_data = [headers]
     for row in table_data:
-        formatted_row = []
-        for header in headers:
-            value = row.get(header, "")
-            
-            # Special handling for matrix data
-            if header == "Matrix" and isinstance(value, str):
-                # Preserve line breaks in matrix representations
-                # Replace multiple spaces with non-breaking spaces to maintain alignment
-                formatted_value = value.replace("  ", " \xa0")
-                formatted_row.append(formatted_value)
-            # Convert various types to string representation
-            elif isinstance(value, float):
-                # Format floats with consistent decimal places
-                formatted_row.append(f"{value:.6f}")
-            elif isinstance(value, int):
-                formatted_row.append(str(value))
-            elif isinstance(value, dict):
-                formatted_row.append(str(value))
-            else:
-                formatted_row.append(str(value))
-                
-        formatted_data.append(formatted_row)
+        formatted_data.append([_format_cell(header, row.get(header, "")) for header in headers])
     
     return formatted_data
 
-def export_to_pdf(filename: str, func: str, method: str, root: Any, table_data: List[Dict[str, Any]]) -> bool:
+def export_to_pdf(filename: str, func: str, method: str, root: Any, table_data: Iterable[Dict[str, Any]]) -> bool:
     """
     Export solution to a PDF file.
+
+    ``table_data`` may be any iterable of row dictionaries. All rows are formatted
+    up front; the ``LongTable`` only splits them row by row across pages.
     """
     try:
         # Sanitize filename
@@ -136,46 +131,45 @@ def export_to_pdf(filename: str, func: str, method: str, root: Any, table_data:
         elements.append(Spacer(1, 0.25 * inch))
         elements.append(Paragraph("Iteration Details", heading_style))
         
-        # Format table data
-        formatted_data = format_table_data(table_data)
-        
-        # Create table
-        if formatted_data:
-            # Adjust column widths for better display of matrix data
-            col_widths = None
-            if is_matrix_method and len(formatted_data) > 0 and len(formatted_data[0]) > 0:
-                # Make the Matrix column wider for matrix methods
-                col_widths = [1.0 * inch]  # Step column
-                for i in range(1, len(formatted_data[0])):
-                    if i == 1 and formatted_data[0][i] == "Matrix":  # Matrix column
-                        col_widths.append(3.5 * inch)  # Make Matrix column wider
-                    else:
-                        col_widths.append(2.0 * inch)  # Other columns
-            
-            # Create table with adjusted column widths if needed
-            table = Table(formatted_data, colWidths=col_widths)
-            
-            # Style the table
-            style = TableStyle([
-                ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                ("ALIGN", (0, 0), (-1, 0), "CENTER"),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
-                ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ("ALIGN", (0, 0), (-1, -1), "CENTER")
-            ])
-            
-            # Add special handling for matrix column
-            if is_matrix_method:
-                style.add("ALIGN", (1, 1), (1, -1), "LEFT")  # Left-align matrix column content
-                style.add("LEFTPADDING", (1, 1), (1, -1), 10)  # Add left padding to matrix column
-            
-            table.setStyle(style)
-            elements.append(table)
+        # Format all rows; the first is the header row
+        formatted_rows = format_table_data(table_data)
+        headers = formatted_rows[0]
+        
+        # Adjust column widths for better display of matrix data
+        col_widths = None
+        if is_matrix_method and headers:
+            # Make the Matrix column wider for matrix methods
+            col_widths = [1.0 * inch]  # Step column
+            for i in range(1, len(headers)):
+                if i == 1 and headers[i] == "Matrix":  # Matrix column
+                    col_widths.append(3.5 * inch)  # Make Matrix column wider
+                else:
+                    col_widths.append(2.0 * inch)  # Other columns
         
+        # Style the table
+        style = TableStyle([
+            ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+            ("ALIGN", (0, 0), (-1, 0), "CENTER"),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+            ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
+            ("GRID", (0, 0), (-1, -1), 1, colors.black),
+            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+            ("ALIGN", (0, 0), (-1, -1), "CENTER")
+        ])
+        
+        # Add special handling for matrix column
+        if is_matrix_method:
+            style.add("ALIGN", (1, 1), (1, -1), "LEFT")  # Left-align matrix column content
+            style.add("LEFTPADDING", (1, 1), (1, -1), 10)  # Add left padding to matrix column
+        
+        # LongTable splits the rows across pages one row at a time and repeats the header on each page
+        table = LongTable(formatted_rows, colWidths=col_widths,
+                          repeatRows=1, splitByRow=1)
+        table.setStyle(style)
+        elements.append(table)
+
         # Build PDF
         doc.build(elements)
         return True
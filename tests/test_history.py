@@ -0,0 +1,118 @@
+import unittest
+import sys
+import os
+import tempfile
+from unittest.mock import patch
+
+# Add the src directory to the path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.history import HistoryManager
+
+class TestHistoryManager(unittest.TestCase):
+    def setUp(self):
+        """Set up a history manager backed by a temporary file."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "history.json")
+        self.history_manager = HistoryManager(self.file_path)
+
+    def tearDown(self):
+        """Remove the temporary history file."""
+        self.temp_dir.cleanup()
+
+    def test_version_changes_on_write(self):
+        """Test that the data version changes whenever history is written."""
+        version = self.history_manager.version()
+
+        self.assertTrue(self.history_manager.save_solution("x**2 - 4", "Bisection", 2.0, []))
+        self.assertNotEqual(self.history_manager.version(), version)
+
+        version = self.history_manager.version()
+        self.assertTrue(self.history_manager.clear_history())
+        self.assertNotEqual(self.history_manager.version(), version)
+
+    def test_version_unchanged_on_read(self):
+        """Test that reading history does not change the data version."""
+        self.history_manager.save_solution("x**2 - 4", "Bisection", 2.0, [])
+        version = self.history_manager.version()
+
+        self.history_manager.load_history()
+        self.history_manager.get_solution(0)
+        self.assertEqual(self.history_manager.version(), version)
+
+    def test_save_and_load(self):
+        """Test that saved solutions are returned by load_history."""
+        self.history_manager.save_solution("x**2 - 4", "Bisection", 2.0, [{"Iteration": 1}])
+
+        history = self.history_manager.load_history()
+        self.assertEqual(len(history), 1)
+        self.assertEqual(history[0]["function"], "x**2 - 4")
+        self.assertEqual(history[0]["iterations"], [{"Iteration": 1}])
+
+    def test_load_uses_memory_copy(self):
+        """Test that loading unchanged history does not read the file again."""
+        self.history_manager.save_solution("x**2 - 4", "Bisection", 2.0, [])
+        self.history_manager.load_history()
+
+        with patch("src.core.history.open", create=True) as file_open:
+            history = self.history_manager.load_history()
+        file_open.assert_not_called()
+        self.assertEqual(len(history), 1)
+
+    def test_load_returns_independent_list(self):
+        """Test that changing a loaded list does not change the stored history."""
+        self.history_manager.save_solution("x**2 - 4", "Bisection", 2.0, [])
+
+        history = self.history_manager.load_history()
+        history.clear()
+        self.assertEqual(len(self.history_manager.load_history()), 1)
+
+        history = self.history_manager.load_history()
+        self.history_manager.save_solution("x**3 - 8", "Bisection", 2.0, [])
+        self.assertEqual(len(history), 1)
+        self.assertEqual(len(self.history_manager.load_history()), 2)
+
+    def test_load_returns_independent_entries(self):
+        """Test that changing a loaded entry or the saved rows does not change the stored history."""
+        rows = [{"Iteration": 1, "Xr": [1.5, 2.0]}]
+        self.history_manager.save_solution("x**2 - 4", "Bisection", 2.0, rows)
+        rows[0]["Xr"].append(3.0)
+
+        history = self.history_manager.load_history()
+        history[0]["function"] = "changed"
+        history[0]["iterations"][0]["Iteration"] = 99
+
+        entry = self.history_manager.load_history()[0]
+        self.assertEqual(entry["function"], "x**2 - 4")
+        self.assertEqual(entry["iterations"], [{"Iteration": 1, "Xr": [1.5, 2.0]}])
+
+    def test_external_change_reloads(self):
+        """Test that a history file changed by another process is read again."""
+        self.history_manager.save_solution("x**2 - 4", "Bisection", 2.0, [])
+        version = self.history_manager.version()
+
+        other = HistoryManager(self.file_path)
+        other.save_solution("x**3 - 8", "Bisection", 2.0, [])
+        # Make sure the change is visible even on file systems with coarse timestamps
+        stat = os.stat(self.file_path)
+        os.utime(self.file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        self.assertNotEqual(self.history_manager.version(), version)
+        history = self.history_manager.load_history()
+        self.assertEqual(len(history), 2)
+
+    def test_failed_write_reloads_from_disk(self):
+        """Test that a failed write does not leave unsaved entries in memory."""
+        self.history_manager.save_solution("x**2 - 4", "Bisection", 2.0, [])
+        self.history_manager.load_history()
+
+        self.history_manager.file_path = os.path.join(self.temp_dir.name, "missing", "history.json")
+        self.assertFalse(self.history_manager.save_solution("x**3 - 8", "Bisection", 2.0, []))
+        self.history_manager.file_path = self.file_path
+
+        history = self.history_manager.load_history()
+        self.assertEqual(len(history), 1)
+        self.assertEqual(history[0]["function"], "x**2 - 4")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,11 +2,14 @@ import unittest
 import sys
 import os
 import math
+import tempfile
 
 # Add the src directory to the path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.core.solver import Solver
+from src.core.history import HistoryManager
+from src.core.methods.base import MATH_PREFIX
 
 class TestSolver(unittest.TestCase):
     def setUp(self):
@@ -124,5 +127,76 @@ class TestSolver(unittest.TestCase):
         self.assertIsNone(root)
         self.assertIn("Error", error[0])
 
+    def test_apply_settings(self):
+        """Test applying and resetting calculation settings."""
+        self.solver.apply_settings(decimal_places=3, max_iter=10, eps=0.01)
+        self.assertEqual(self.solver.decimal_places, 3)
+        self.assertEqual(self.solver.max_iter, 10)
+        self.assertEqual(self.solver.eps, 0.01)
+        
+        # Unknown settings are rejected without changing anything
+        with self.assertRaises(ValueError):
+            self.solver.apply_settings(max_iter=20, unknown=1)
+        self.assertEqual(self.solver.max_iter, 10)
+        
+        self.solver.apply_defaults()
+        for name, value in Solver.DEFAULT_SETTINGS.items():
+            self.assertEqual(getattr(self.solver, name), value)
+
+    def test_settings_initialized(self):
+        """Test that a new solver has every calculation setting, including max_eps."""
+        solver = Solver()
+        for name, value in Solver.DEFAULT_SETTINGS.items():
+            self.assertEqual(getattr(solver, name), value)
+        self.assertEqual(solver.max_eps, Solver.DEFAULT_SETTINGS["max_eps"])
+
+    def test_repeated_solve_saved_to_history(self):
+        """Test that solving the same problem twice records two history entries."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.solver.history_manager = HistoryManager(os.path.join(temp_dir, "history.json"))
+            params = {"xl": 0, "xu": 3}
+            
+            first, first_table = self.solver.solve("Bisection", "x**2 - 4", params, 0.0001, "<=", 50, True)
+            second, second_table = self.solver.solve("Bisection", "x**2 - 4", params, 0.0001, "<=", 50, True)
+            
+            self.assertEqual(first, second)
+            # Each caller gets its own table list
+            self.assertIsNot(first_table, second_table)
+            self.assertEqual(len(self.solver.history_manager.load_history()), 2)
+
+    def test_cached_rows_not_shared(self):
+        """Test that changing a returned table does not change later results or history."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.solver.history_manager = HistoryManager(os.path.join(temp_dir, "history.json"))
+            params = {"xl": 0, "xu": 3}
+            
+            _, table = self.solver.solve("Bisection", "x**2 - 4", params, 0.0001, "<=", 50, True)
+            expected = table[0]["Xr"]
+            table[0]["Xr"] = "changed"
+            table.append({"Summary": "row"})
+            
+            _, again = self.solver.solve("Bisection", "x**2 - 4", params, 0.0001, "<=", 50, True)
+            self.assertEqual(again[0]["Xr"], expected)
+            self.assertEqual(len(again), len(table) - 1)
+            for entry in self.solver.history_manager.load_history():
+                self.assertEqual(entry["iterations"][0]["Xr"], expected)
+
+    def test_only_successful_solves_cached(self):
+        """Test that failed solves are not cached and unhashable parameters still solve."""
+        root, _ = self.solver.solve("Unknown Method", "x**2 - 4", {"xl": 0, "xu": 3}, 0.0001, "<=", 50, True)
+        self.assertIsNone(root)
+        self.assertEqual(len(self.solver._solve_cache), 0)
+        
+        root, _ = self.solver.solve("Bisection", "x**2 - 4", {"xl": 0, "xu": 3, "extra": {}}, 0.0001, "<=", 50, True)
+        self.assertAlmostEqual(root, 2.0, places=3)
+        self.assertEqual(len(self.solver._solve_cache), 0)
+
+    def test_math_prefix_accepted(self):
+        """Test that functions written with a math. prefix are accepted."""
+        self.assertIsNone(self.solver.validate_function("math.sin(x) + math.log10(x) - math.sqrt(x)"))
+        self.assertEqual(MATH_PREFIX.sub("", "math.exp(x) * math.log10(x)"), "exp(x) * log10(x)")
+        # Only a standalone math. prefix is removed, not one inside a longer name
+        self.assertEqual(MATH_PREFIX.sub("", "mymath.sin(x) + xmath.log(x)"), "mymath.sin(x) + xmath.log(x)")
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file